@@ -53,17 +53,22 @@ def _rstr(f) -> str:
         buf.append(c)
 
 
-def _read_header(f) -> dict:
-    """Read EXR header → dict of {attr_name: (type_str, raw_bytes)}."""
+def _read_header(f, strict: bool = True) -> dict:
+    """Read EXR header → dict of {attr_name: (type_str, raw_bytes)}.
+
+    strict=False skips the tiled/deep/multi-part checks; the first header
+    still parses, which is enough for attributes such as dataWindow.
+    """
     magic, version_word = struct.unpack('<II', f.read(8))
     if magic != _MAGIC:
         raise ExrError('Not an EXR file')
-    if version_word & 0x200:   # bit 9 = tiled (block layout differs from scanline)
-        raise UnsupportedCompression('Tiled EXR not supported by _pure_exr')
-    if version_word & 0x800:   # bit 11 = deep data
-        raise UnsupportedCompression('Deep EXR not supported by _pure_exr')
-    if version_word & 0x1000:  # bit 12 = multi-part
-        raise UnsupportedCompression('Multi-part EXR not supported by _pure_exr')
+    if strict:
+        if version_word & 0x200:   # bit 9 = tiled (block layout differs from scanline)
+            raise UnsupportedCompression('Tiled EXR not supported by _pure_exr')
+        if version_word & 0x800:   # bit 11 = deep data
+            raise UnsupportedCompression('Deep EXR not supported by _pure_exr')
+        if version_word & 0x1000:  # bit 12 = multi-part
+            raise UnsupportedCompression('Multi-part EXR not supported by _pure_exr')
     attrs = {}
     while True:
         name = _rstr(f)
@@ -164,6 +169,14 @@ def get_exr_layers(path: str) -> list:
     return sorted(layers) if layers else ['rgba']
 
 
+def read_exr_size(path: str) -> tuple:
+    """Return (width, height) of the data window from the header alone."""
+    with open(path, 'rb') as f:
+        attrs = _read_header(f, strict=False)
+    x0, y0, x1, y1 = struct.unpack('<4i', attrs['dataWindow'][1])
+    return x1 - x0 + 1, y1 - y0 + 1
+
+
 def read_exr(path: str, layer: str = 'rgba') -> np.ndarray:
     """Return (H, W, 3|4) float32 array in linear space, or raise ExrError."""
     with open(path, 'rb') as f:
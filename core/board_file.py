@@ -7,8 +7,12 @@ from __future__ import annotations
 
 import os
 import json
+import hashlib
 import shutil
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,19 +22,245 @@ try:
     from PySide2.QtCore import QTimer
     from PySide2.QtGui import QColor
     from PySide2.QtWidgets import (QMessageBox, QDialog, QVBoxLayout, QHBoxLayout,
-                                    QLabel, QComboBox, QPushButton, QScrollArea, QWidget)
+                                    QLabel, QComboBox, QPushButton, QScrollArea, QWidget,
+                                    QGraphicsScene, QGraphicsItem)
 except ImportError:
     from PySide6.QtCore import QTimer
     from PySide6.QtGui import QColor
     from PySide6.QtWidgets import (QMessageBox, QDialog, QVBoxLayout, QHBoxLayout,
-                                    QLabel, QComboBox, QPushButton, QScrollArea, QWidget)
+                                    QLabel, QComboBox, QPushButton, QScrollArea, QWidget,
+                                    QGraphicsScene, QGraphicsItem)
+
+
+# orjson is optional — several times faster than stdlib json for large boards.
+# Output is compact: the manifest lives inside a zip, so indentation only costs
+# formatting time and archive size.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
+
+# Boards are zip archives holding a single JSON manifest; image files stay in
+# the <board>_images/ folder next to the archive.
+_MANIFEST_NAME = 'manifest.json'
+
+# Parallel consolidation copies
+_COPY_WORKERS = 8
+
+# Load defaults for keys missing from older boards — tuples, so the load loop
+# doesn't build a fresh default list for every entry
+_DEFAULT_POS = (0.0, 0.0)
+_DEFAULT_TEXT_COLOR = (255, 255, 255, 255)
+_DEFAULT_STROKE_COLOR = (0, 200, 180, 220)
+
+# Qt maps PNG "quality" to zlib level as (100 - q) * 9 / 91, so 89 -> level 1:
+# several times faster than the default level 6 on screenshots, still lossless.
+_CLIPBOARD_PNG_QUALITY = 89
+
+
+def _write_board_file(file_path: str, board_data: dict) -> None:
+    """Write board_data as a deflate-compressed .board archive."""
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+        zf.writestr(_MANIFEST_NAME, _dumps(board_data))
+
+
+def read_board_file(file_path: str) -> dict:
+    """Read a board file — zip archive, or plain JSON for boards saved before the archive format."""
+    if zipfile.is_zipfile(file_path):
+        with zipfile.ZipFile(file_path, 'r') as zf:
+            return _loads(zf.read(_MANIFEST_NAME))
+    with open(file_path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy with os.copy_file_range; return False if the kernel copied nothing.
+
+    Unlike sendfile, copy_file_range lets the filesystem do the copy itself:
+    a reflink on btrfs/XFS, a server-side copy on NFS 4.2 / SMB.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(infd).st_size
+        while remaining > 0:
+            n = os.copy_file_range(infd, outfd, remaining)
+            if n == 0:
+                return False
+            remaining -= n
+    return True
+
+
+def _copy_asset(src: str, dst: str) -> None:
+    """Copy an image into the consolidation folder.
+
+    Tries copy_file_range first (Linux), then shutil.copyfile, which uses the
+    platform fast-copy path (sendfile on Linux, fcopyfile on macOS). File
+    metadata is not needed for consolidated copies.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            if _copy_file_range(src, dst):
+                return
+        except OSError:
+            pass  # EXDEV/ENOSYS/EINVAL on older kernels or filesystems — dst is rewritten below
+    shutil.copyfile(src, dst)
+
+
+def _pos_list(item) -> list:
+    """Item position as [x, y] — one pos() call (a QPointF copy across the binding) instead of two."""
+    p = item.pos()
+    return [p.x(), p.y()]
+
+
+def _run_copies(tasks) -> None:
+    """Run (src, dst) copies on a thread pool; raise OSError listing any failures.
+
+    Copies are I/O-bound, so one slow source (network share, USB drive)
+    no longer stalls every copy queued behind it.
+    """
+    if not tasks:
+        return
+
+    def _copy(task):
+        src, dst = task
+        try:
+            _copy_asset(src, dst)
+        except OSError as e:
+            return f"{src}: {e}"
+        return None
+
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as ex:
+        failures = [f for f in ex.map(_copy, tasks) if f]
+    if failures:
+        raise OSError(f"{len(failures)} file(s) could not be copied:\n" + "\n".join(failures[:5]))
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class _DigestCache:
+    """SHA-256 digests of files in an images folder, persisted in a sidecar file.
+
+    Entries are keyed by filename and validated against size + mtime, so a
+    consolidated file is only re-hashed after it changes on disk.
+    """
+
+    SIDECAR_NAME = '.coffeeboard_digests.json'
+
+    def __init__(self, folder: str) -> None:
+        self._path = os.path.join(folder, self.SIDECAR_NAME)
+        self._dirty = False
+        try:
+            with open(self._path, 'rb') as f:
+                self._entries = _loads(f.read())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def digest(self, path: str) -> str:
+        st = os.stat(path)
+        name = os.path.basename(path)
+        entry = self._entries.get(name)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        sha = _sha256(path)
+        self._entries[name] = [st.st_size, st.st_mtime_ns, sha]
+        self._dirty = True
+        return sha
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            with open(self._path, 'wb') as f:
+                f.write(_dumps(self._entries))
+            self._dirty = False
+        except OSError as e:
+            print(f"Failed to write digest cache {self._path}: {e}")
+
+
+def _uniquify(stem: str, ext: str, used_names: set) -> str:
+    """Return stem+ext, or the first free stem_N+ext, and reserve it in used_names.
+
+    used_names holds os.path.normcase'd filenames so collisions match the
+    filesystem's case rules without a stat per candidate.
+    """
+    filename = f"{stem}{ext}"
+    counter = 1
+    while os.path.normcase(filename) in used_names:
+        filename = f"{stem}_{counter}{ext}"
+        counter += 1
+    used_names.add(os.path.normcase(filename))
+    return filename
+
+
+@contextmanager
+def _quiet_geometry(item):
+    """Turn off ItemSendsGeometryChanges while restoring an item's saved geometry.
+
+    Every board item sets the flag in __init__, so it is switched back on afterwards.
+    """
+    item.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
+    try:
+        yield item
+    finally:
+        item.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+
+
+def _saved_image_size(entry: dict, image_path: str):
+    """On-canvas (w, h) of a saved image entry, or None if it can't be known without decoding.
+
+    Boards saved before "size" existed fall back to the file header times the saved scale.
+    """
+    size = entry.get("size")
+    if size:
+        return float(size[0]), float(size[1])
+    from CoffeeBoard.core.image_loader import source_size
+    src = source_size(image_path)
+    if src is None:
+        return None
+    scale = entry.get("scale", 1.0)
+    return src[0] * scale, src[1] * scale
+
+
+class _DirListing:
+    """Memoized directory listings — probing N files in one folder costs one scandir, not N stats."""
+
+    def __init__(self) -> None:
+        self._names = {}
+
+    def exists(self, path: str) -> bool:
+        folder, name = os.path.split(os.path.normpath(path))
+        names = self._names.get(folder)
+        if names is None:
+            try:
+                with os.scandir(folder or os.curdir) as it:
+                    names = {os.path.normcase(e.name) for e in it}
+            except OSError:  # missing consolidation folder, permissions, ...
+                names = frozenset()
+            self._names[folder] = names
+        return os.path.normcase(name) in names
 
 
 def save_board(board: 'CoffeeBoard') -> None:
-    """Save the current state of the reference board to a JSON file."""
+    """Save the current state of the reference board to a .board archive."""
     # Partition items by type
-    clipboard_items = [i for i in board.image_items if getattr(i, 'path', None) == "clipboard_image"]
-    file_items      = [i for i in board.image_items if getattr(i, 'path', None) != "clipboard_image"]
+    # Only file items are needed as a list; clipboard items just need a yes/no
+    file_items = [i for i in board.image_items if getattr(i, 'path', None) != "clipboard_image"]
+    has_clipboard = len(file_items) != len(board.image_items)
 
     # Resolve save path first so we can check which files are already consolidated
     if board.current_save_path:
@@ -83,12 +313,24 @@ def save_board(board: 'CoffeeBoard') -> None:
             getattr(i, 'consolidation_action', None) in ('move', 'copy')
             for i in file_items
         )
-        need_images_folder = clipboard_items or any_move_copy
+        need_images_folder = has_clipboard or any_move_copy
         if need_images_folder and not os.path.exists(images_folder):
             os.makedirs(images_folder)
 
+        # One listing up front; name allocation below is in-memory only
+        try:
+            used_names = {os.path.normcase(n) for n in os.listdir(images_folder)}
+        except OSError:
+            used_names = set()
+
         copied_count = 0
         clipboard_counter = 0
+        save_timestamp = time.strftime('%Y%m%d_%H%M%S')  # one per save; the counter disambiguates
+        digests = _DigestCache(images_folder)
+        # File copies are collected here and run in parallel after the item loop;
+        # pixmap saves and moves stay on this thread.
+        copy_tasks = []
+        pending_copies = {}  # normcase'd filename -> normcase'd source path
 
         for item in board.image_items:
             image_path = getattr(item, 'path', None)
@@ -100,21 +342,22 @@ def save_board(board: 'CoffeeBoard') -> None:
                 if dn:
                     import re
                     stem = re.sub(r'[^\w]', '_', dn.strip())
-                    filename = f"{stem}.png"
-                    base_filename = filename
-                    counter = 1
-                    while os.path.exists(os.path.join(images_folder, filename)):
-                        filename = f"{stem}_{counter}.png"
-                        counter += 1
                 else:
                     clipboard_counter += 1
-                    filename = f"clipboard_image_{time.strftime('%Y%m%d_%H%M%S')}_{clipboard_counter}.png"
+                    stem = f"clipboard_image_{save_timestamp}_{clipboard_counter}"
+                filename = _uniquify(stem, '.png', used_names)
                 new_image_path = os.path.join(images_folder, filename)
                 try:
-                    item.original_pixmap.save(new_image_path, 'PNG')
+                    # The full-resolution paste, not the display copy capped at DECODE_MAX_EDGE
+                    image = getattr(item, 'clipboard_source', None)
+                    if image is None:
+                        image = item.original_pixmap
+                    if not image.save(new_image_path, 'PNG', _CLIPBOARD_PNG_QUALITY):
+                        raise OSError("PNG encoder failed")
                     copied_count += 1
                     item.path = new_image_path
                     item.display_name = None
+                    item.clipboard_source = None  # now backed by the file
                 except Exception as e:
                     print(f"Failed to write clipboard image to {new_image_path}: {e}")
                     new_image_path = None
@@ -135,17 +378,40 @@ def save_board(board: 'CoffeeBoard') -> None:
                     image_filename = os.path.basename(image_path)
                     base, ext = os.path.splitext(image_filename)
                     counter = 1
-                    new_image_path = os.path.join(images_folder, image_filename)
-                    while os.path.exists(new_image_path):
+                    already_copied = False
+                    src_size = src_sha = None
+                    while os.path.normcase(image_filename) in used_names:
+                        # A previous save may already have copied this exact file —
+                        # reuse it instead of writing another _N duplicate.
+                        pending_src = pending_copies.get(os.path.normcase(image_filename))
+                        if pending_src is not None:
+                            # Reserved earlier in this save, not on disk yet
+                            if item_action == 'copy' and pending_src == norm_image:
+                                already_copied = True
+                                break
+                        elif item_action == 'copy':
+                            taken_path = os.path.join(images_folder, image_filename)
+                            if src_size is None:
+                                src_size = os.path.getsize(image_path)
+                            if os.path.getsize(taken_path) == src_size:
+                                if src_sha is None:
+                                    src_sha = _sha256(image_path)
+                                if digests.digest(taken_path) == src_sha:
+                                    already_copied = True
+                                    break
                         image_filename = f"{base}_{counter}{ext}"
-                        new_image_path = os.path.join(images_folder, image_filename)
                         counter += 1
+                    used_names.add(os.path.normcase(image_filename))
+                    new_image_path = os.path.join(images_folder, image_filename)
                     if item_action == 'copy':
-                        shutil.copy2(image_path, new_image_path)
+                        if not already_copied:
+                            copy_tasks.append((image_path, new_image_path))
+                            pending_copies[os.path.normcase(image_filename)] = norm_image
+                            copied_count += 1
                     else:  # 'move'
                         shutil.move(image_path, new_image_path)
                         item.path = new_image_path
-                    copied_count += 1
+                        copied_count += 1
                     rel_path = os.path.join(f"{base_name}_images", image_filename)
                     abs_path = new_image_path
                 else:  # 'leave' or None — store relative path if possible
@@ -160,8 +426,13 @@ def save_board(board: 'CoffeeBoard') -> None:
                 "type": "image",
                 "path": rel_path if rel_path else abs_path,
                 "absolute_path": abs_path,
-                "position": [item.pos().x(), item.pos().y()],
-                "scale": item.current_scale,
+                "position": _pos_list(item),
+                # Scale is stored against the source resolution so boards survive
+                # changes to the loader's decode cap
+                "scale": item.current_scale / getattr(item, 'decode_ratio', 1.0),
+                # On-canvas size, so load can lay out placeholders before decoding
+                "size": [item.base_width() * item.current_scale,
+                         item.base_height() * item.current_scale],
                 "z_value": item.zValue(),
                 "layer": getattr(item, 'layer', 'rgba'),
                 "preview_format": getattr(item, 'preview_format', board.preview_format),
@@ -176,6 +447,8 @@ def save_board(board: 'CoffeeBoard') -> None:
             }
             board_data["items"].append(image_data)
 
+        _run_copies(copy_tasks)
+
         # Save text items
         for item in board.text_items:
             c = item.text_color
@@ -187,7 +460,7 @@ def save_board(board: 'CoffeeBoard') -> None:
                 "bold": item.bold,
                 "italic": item.italic,
                 "color": [c.red(), c.green(), c.blue(), c.alpha()],
-                "position": [item.pos().x(), item.pos().y()],
+                "position": _pos_list(item),
                 "scale": item.current_scale,
                 "z_value": item.zValue(),
                 "rotation": item.rotation(),
@@ -203,7 +476,7 @@ def save_board(board: 'CoffeeBoard') -> None:
                 "stroke_color": [sc.red(), sc.green(), sc.blue(), sc.alpha()],
                 "fill_color": [fc.red(), fc.green(), fc.blue(), fc.alpha()] if fc is not None else None,
                 "stroke_width": item.stroke_width,
-                "position": [item.pos().x(), item.pos().y()],
+                "position": _pos_list(item),
                 "z_value": item.zValue(),
             }
             if item.shape_type in ('line', 'arrow'):
@@ -216,9 +489,10 @@ def save_board(board: 'CoffeeBoard') -> None:
                 entry["rotation"] = item.rotation()
             board_data["items"].append(entry)
 
-        # Write JSON
-        with open(file_path, 'w') as f:
-            json.dump(board_data, f, indent=2)
+        digests.save()
+
+        # Write archive
+        _write_board_file(file_path, board_data)
 
         board.current_save_path = file_path
         print(f"Reference board saved to: {file_path} (copied {copied_count} files)")
@@ -229,11 +503,11 @@ def save_board(board: 'CoffeeBoard') -> None:
 
 
 def load_board(board: 'CoffeeBoard', path=None) -> None:
-    """Load the saved state of a reference board from a JSON file.
+    """Load the saved state of a reference board from a .board archive or legacy JSON file.
 
     Args:
         board: The CoffeeBoard instance.
-        path: Optional path to the JSON file. If None, prompts the user.
+        path: Optional path to the board file. If None, prompts the user.
     """
     from CoffeeBoard.core.image_item import ImageDisplay
     from CoffeeBoard.core.text_item import TextItem
@@ -249,8 +523,7 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
 
     try:
         # Read the file
-        with open(file_path, 'r') as f:
-            board_data = json.load(f)
+        board_data = read_board_file(file_path)
 
         # Clear existing items
         board.clear_all_images()
@@ -261,26 +534,38 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
         total_items = len(all_items)
         missing_images = []
         loaded_count = 0
+        listing = _DirListing()
 
         # Create progress task
         progress = board.bridge.create_progress("Loading Reference Board")
         progress.setMessage(f"Loading {total_items} items...")
 
+        old_index = board.scene.itemIndexMethod()
+        deferred_items = []  # placeholders to decode once the loop is done
         try:
+            # Same batching as dropEvent: no repaints and no BSP index upkeep per
+            # addItem; the index is rebuilt once when restored below.
+            board.setUpdatesEnabled(False)
+            board.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+
+            # Progress calls can repaint the dialog (or cross into Nuke) — update ~every 1%
+            update_every = max(1, total_items // 100)
+            pct_per_item = 100.0 / total_items if total_items else 0.0
+
             for idx, entry in enumerate(all_items):
                 if progress.isCancelled():
                     print("Load cancelled by user")
                     break
 
-                progress_percent = int((idx / float(total_items)) * 100) if total_items else 100
-                progress.setProgress(progress_percent)
-                progress.setMessage(f"Loading item {idx + 1} of {total_items}...")
+                if idx % update_every == 0:
+                    progress.setProgress(int(idx * pct_per_item))
+                    progress.setMessage(f"Loading item {idx + 1} of {total_items}...")
 
                 item_type = entry.get("type", "image")
 
                 if item_type == "text":
                     try:
-                        color_data = entry.get("color", [255, 255, 255, 255])
+                        color_data = entry.get("color", _DEFAULT_TEXT_COLOR)
                         color = QColor(*color_data)
                         text_item = TextItem(
                             text=entry.get("text", ""),
@@ -288,19 +573,21 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
                             font_size_pt=entry.get("font_size_pt", 24.0),
                             color=color,
                         )
-                        board.scene.addItem(text_item)
-                        board.text_items.append(text_item)
-
                         if entry.get("bold", False):
                             text_item.set_bold(True)
                         if entry.get("italic", False):
                             text_item.set_italic(True)
 
-                        pos = entry.get("position", [0, 0])
-                        text_item.setPos(pos[0], pos[1])
-                        text_item.resize_item(entry.get("scale", 1.0))
-                        text_item.setRotation(entry.get("rotation", 0.0))
-                        text_item.setZValue(entry.get("z_value", 0))
+                        # Restore geometry before adding, so the scene sees one insertion
+                        with _quiet_geometry(text_item):
+                            pos = entry.get("position", _DEFAULT_POS)
+                            text_item.setPos(pos[0], pos[1])
+                            text_item.resize_item(entry.get("scale", 1.0))
+                            text_item.setRotation(entry.get("rotation", 0.0))
+                            text_item.setZValue(entry.get("z_value", 0))
+                        board._note_z(text_item.zValue())
+                        board.scene.addItem(text_item)
+                        board.text_items.append(text_item)
 
                         loaded_count += 1
                     except Exception as e:
@@ -308,12 +595,13 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
 
                 elif item_type == "shape":
                     try:
-                        sc_data = entry.get("stroke_color", [0, 200, 180, 220])
+                        sc_data = entry.get("stroke_color", _DEFAULT_STROKE_COLOR)
                         stroke_color = QColor(*sc_data)
                         fc_data = entry.get("fill_color")
                         fill_color = QColor(*fc_data) if fc_data is not None else None
                         shape_type = entry.get("shape_type", "rect")
-                        if shape_type in ('line', 'arrow'):
+                        is_line = shape_type in ('line', 'arrow')
+                        if is_line:
                             # Backward compat: old files may have nat_w/nat_h instead of dx/dy
                             shape_item = ShapeItem(
                                 shape_type=shape_type,
@@ -323,8 +611,6 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
                                 fill_color=fill_color,
                                 stroke_width=entry.get("stroke_width", 2.0),
                             )
-                            pos = entry.get("position", [0, 0])
-                            shape_item.setPos(pos[0], pos[1])
                         else:
                             shape_item = ShapeItem(
                                 shape_type=shape_type,
@@ -334,30 +620,38 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
                                 fill_color=fill_color,
                                 stroke_width=entry.get("stroke_width", 2.0),
                             )
-                            pos = entry.get("position", [0, 0])
+                        with _quiet_geometry(shape_item):
+                            pos = entry.get("position", _DEFAULT_POS)
                             shape_item.setPos(pos[0], pos[1])
-                            shape_item.resize_item(entry.get("scale", 1.0))
-                            shape_item.setRotation(entry.get("rotation", 0.0))
+                            if not is_line:
+                                shape_item.resize_item(entry.get("scale", 1.0))
+                                shape_item.setRotation(entry.get("rotation", 0.0))
+                            shape_item.setZValue(entry.get("z_value", 0))
+                        board._note_z(shape_item.zValue())
                         board.scene.addItem(shape_item)
                         board.shape_items.append(shape_item)
-                        shape_item.setZValue(entry.get("z_value", 0))
 
                         loaded_count += 1
                     except Exception as e:
                         print(f"Failed to restore shape item: {e}")
 
                 else:  # "image" (including old entries without "type")
-                    # Try relative path first, then absolute
+                    # Try relative path first, then absolute. Both go through the
+                    # directory listings, so a board moved away from its images
+                    # folder costs one scandir of the old folder, not a stat per miss.
                     image_path = None
+                    test_path = None
                     rel_path = entry.get("path")
                     abs_path = entry.get("absolute_path")
 
                     if rel_path:
                         test_path = os.path.join(load_dir, rel_path)
-                        if os.path.exists(test_path):
+                        if listing.exists(test_path):
                             image_path = test_path
 
-                    if not image_path and abs_path and os.path.exists(abs_path):
+                    # "path" falls back to the absolute path when no relpath existed
+                    if (not image_path and abs_path and abs_path != test_path
+                            and listing.exists(abs_path)):
                         image_path = abs_path
 
                     if image_path:
@@ -365,16 +659,26 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
                             layer = entry.get("layer", "rgba")
                             preview_format = entry.get("preview_format", board.preview_format)
 
-                            image_item = ImageDisplay(image_path, layer, preview_format)
+                            # Decode in the background behind a gray box of the saved size;
+                            # entries whose size is unknown load synchronously as before
+                            size = _saved_image_size(entry, image_path)
+                            if size is not None:
+                                image_item = ImageDisplay.create_placeholder(
+                                    image_path, layer, preview_format, size, entry.get("scale", 1.0))
+                                deferred_items.append(image_item)
+                            else:
+                                image_item = ImageDisplay(image_path, layer, preview_format)
+
+                            with _quiet_geometry(image_item):
+                                pos = entry.get("position", _DEFAULT_POS)
+                                image_item.setPos(pos[0], pos[1])
+                                image_item.resize_image(entry.get("scale", 1.0) * image_item.decode_ratio)
+                                image_item.setRotation(entry.get('rotation', 0.0))
+                                image_item.setZValue(entry.get("z_value", 0))
+                            board._note_z(image_item.zValue())
                             board.scene.addItem(image_item)
                             board.image_items.append(image_item)
 
-                            pos = entry.get("position", [0, 0])
-                            image_item.setPos(pos[0], pos[1])
-                            image_item.resize_image(entry.get("scale", 1.0))
-                            image_item.setRotation(entry.get('rotation', 0.0))
-                            image_item.setZValue(entry.get("z_value", 0))
-
                             image_item.display_name = entry.get('display_name')
                             image_item.consolidation_action = entry.get('consolidation_action')
 
@@ -397,12 +701,14 @@ def load_board(board: 'CoffeeBoard', path=None) -> None:
 
         finally:
             del progress
+            board.scene.setItemIndexMethod(old_index)
+            board.setUpdatesEnabled(True)
+            # Started only now, so no decode result lands on a half-restored item
+            for image_item in deferred_items:
+                image_item.load_async()
 
         # Update scene rect
-        if board.image_items or board.text_items or board.shape_items:
-            items_rect = board.scene.itemsBoundingRect()
-            padded_rect = items_rect.adjusted(-50, -50, 50, 50)
-            board.scene.setSceneRect(padded_rect)
+        board._grow_scene_rect()
 
         board.current_save_path = file_path
 
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import math
 import os
-import json
+import time
 from functools import partial
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from CoffeeBoard.core.image_item import ImageDisplay
 from CoffeeBoard.core.text_item import TextItem
@@ -14,12 +16,12 @@ from CoffeeBoard.ui.dialogs import EXRImportDialog
 from CoffeeBoard.ui.image_settings_panel import ImageSettingsPanel
 from CoffeeBoard.ui.text_settings_panel import TextSettingsPanel
 from CoffeeBoard.ui.platform_bridge import get_bridge
-from CoffeeBoard.core.image_loader import get_exr_layers
+from CoffeeBoard.core.image_loader import get_exr_layers, source_size, decoded_size
 
 try:
-    from PySide2.QtCore import Qt, QRectF, QPointF, QPoint, QEvent
+    from PySide2.QtCore import Qt, QRectF, QPointF, QPoint, QEvent, QTimer
     from PySide2.QtGui import (
-        QPixmap, QKeySequence, QBrush, QColor,
+        QKeySequence, QBrush, QColor,
         QDragEnterEvent, QDragMoveEvent, QDropEvent, QWheelEvent,
         QMouseEvent, QKeyEvent
     )
@@ -27,9 +29,9 @@ try:
         QGraphicsView, QGraphicsScene, QDialog, QApplication, QShortcut, QAction, QMenu, QMessageBox, QWidget,
     )
 except ImportError:
-    from PySide6.QtCore import Qt, QRectF, QPointF, QPoint, QEvent
+    from PySide6.QtCore import Qt, QRectF, QPointF, QPoint, QEvent, QTimer
     from PySide6.QtGui import (
-        QPixmap, QKeySequence, QShortcut, QAction, QBrush, QColor,
+        QKeySequence, QShortcut, QAction, QBrush, QColor,
         QDragEnterEvent, QDragMoveEvent, QDropEvent, QWheelEvent,
         QMouseEvent, QKeyEvent,
     )
@@ -38,6 +40,13 @@ except ImportError:
     )
 
 
+SUPPORTED_EXTS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".exr"})
+_BASE_SCENE_RECT = QRectF(-5000, -5000, 10000, 10000)
+_SCENE_RECT_PAD = 500.0
+_PROGRESS_INTERVAL = 0.016  # seconds between progress UI updates
+_UNSUPPORTED_MSG = "Unsupported file type dropped:\n{}\n\nOnly supports JPG, PNG, EXR, TIFF, BMP."
+
+
 class CoffeeBoard(QGraphicsView):
     """A custom QGraphicsView designed as an interactive reference board for VFX workflows.
 
@@ -45,7 +54,7 @@ class CoffeeBoard(QGraphicsView):
     drag-and-drop file loading (including EXR files), copying images from the system
     clipboard, and manages image items via the ImageDisplay class. Key functionality
     includes pan/zoom navigation, asset consolidation for portability, and saving
-    the board's layout state to JSON.
+    the board's layout state to a .board archive.
 
     Attributes (State Variables):
         scene (QGraphicsScene): The scene object managed by the view, containing all image items.
@@ -96,16 +105,22 @@ class CoffeeBoard(QGraphicsView):
         self.setAcceptDrops(True)
 
 
+        # The view's rect is huge so panning is never locked to content bounds.
+        # The scene's own rect (which the BSP index subdivides) stays close to
+        # the items and grows on demand — see _grow_scene_rect().
         SCENE_SIZE = 1000000
         huge_rect = QRectF(-SCENE_SIZE, -SCENE_SIZE, 2*SCENE_SIZE, 2*SCENE_SIZE)
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
 
-        self.scene.setSceneRect(huge_rect)
+        self.setSceneRect(huge_rect)
+        self.scene.setSceneRect(_BASE_SCENE_RECT)
         self.setBackgroundBrush(QBrush(QColor(35, 35, 35)))
 
-        # Set up rendering and interaction
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Set up rendering and interaction — repaint only dirty regions by default;
+        # rubber-band drags switch to full updates temporarily (see mousePressEvent).
+        self._idle_update_mode = QGraphicsView.MinimalViewportUpdate
+        self.setViewportUpdateMode(self._idle_update_mode)
         self.setTransformationAnchor(QGraphicsView.NoAnchor)
         self.setResizeAnchor(QGraphicsView.NoAnchor)
 
@@ -113,8 +128,9 @@ class CoffeeBoard(QGraphicsView):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        # Enable drag mode for item selection, but we'll override for panning
-        self.setDragMode(QGraphicsView.RubberBandDrag)
+        # Rubber-band selection is only switched on while a left-drag that
+        # started on empty canvas is in progress (see mousePressEvent).
+        self.setDragMode(QGraphicsView.NoDrag)
 
         # State variables
         self.pan_origin = QPointF()
@@ -123,8 +139,22 @@ class CoffeeBoard(QGraphicsView):
         self.text_items = []
         self.shape_items = []
         self._last_context_pos = QPointF()
+        self._exr_layer_cache: Dict[Tuple[str, float], List[str]] = {}
         self.current_save_path = None
+        # Running z bounds for board items: they only widen (see _note_z), so
+        # front/back never need to scan every item.
+        self._max_z = 0.0
+        self._min_z = 0.0
         self.scale_factor = 1.0
+        self._inv_scale_factor = 1.0  # kept in sync with scale_factor for panning
+
+        # Wheel zoom coalescing — ticks accumulate until the event loop is idle
+        self._pending_zoom_steps = 0
+        self._pending_zoom_pos = QPoint()
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(0)
+        self._wheel_timer.timeout.connect(self._apply_zoom)
 
         # Draw mode state
         self._draw_mode = None
@@ -163,6 +193,9 @@ class CoffeeBoard(QGraphicsView):
             # bind scale directly to avoid late-binding lambda problems
             act.triggered.connect(partial(self.resize_selected_images, scale))
             self.resize_actions.append(act)
+        # Built once and re-attached to each context menu
+        self._resize_submenu = QMenu("Resize", self)
+        self._resize_submenu.addActions(self.resize_actions)
 
 
         self.bring_front_action = QAction("Bring to Front", self)
@@ -228,13 +261,39 @@ class CoffeeBoard(QGraphicsView):
         self.undo_stack.changed_callback = self._item_list_panel.refresh
         self.scene.selectionChanged.connect(self._item_list_panel._sync_selection_from_scene)
 
+        # Selection snapshots, rebuilt once per selectionChanged instead of
+        # re-scanning the scene on every right-click / key press.
+        self._selected_items: List = []
+        self._selected_image_items: set = set()
+        self._selected_board_items: List = []  # images, texts and shapes only
+        self.scene.selectionChanged.connect(self._on_selection_changed)
+
         self._item_list_action = QAction("Item List", self)
         self._item_list_action.setCheckable(True)
         self._item_list_action.triggered.connect(self._toggle_item_list_panel)
 
+    def _on_selection_changed(self) -> None:
+        # Rebind rather than mutate so loops over the previous snapshot stay valid
+        # while they delete/deselect items (which re-enters this slot).
+        self._selected_items = self.scene.selectedItems()
+        self._selected_image_items = {i for i in self._selected_items if isinstance(i, ImageDisplay)}
+        self._selected_board_items = [i for i in self._selected_items
+                                      if isinstance(i, (ImageDisplay, TextItem, ShapeItem))]
+
     def updateValue(self) -> None:
         pass  # Required by Nuke's panel API; CoffeeBoard has no knob values to sync.
 
+    def set_full_viewport_update(self, enabled: bool) -> None:
+        """Toggle full-viewport repaints (useful when heavy zoom leaves artifacts).
+
+        Args:
+            enabled (bool): True to always repaint the whole viewport, False to
+                            repaint only the changed regions (default).
+        """
+        self._idle_update_mode = (QGraphicsView.FullViewportUpdate if enabled
+                                  else QGraphicsView.MinimalViewportUpdate)
+        self.setViewportUpdateMode(self._idle_update_mode)
+
     def set_background_for_theme(self, theme: str) -> None:
         color = QColor(35, 35, 35) if theme != "light" else QColor(220, 220, 220)
         self.setBackgroundBrush(QBrush(color))
@@ -252,7 +311,7 @@ class CoffeeBoard(QGraphicsView):
             self._draw_preview = None
         self._draw_mode = None
         self._draw_start_scene = None
-        self.setDragMode(QGraphicsView.RubberBandDrag)
+        self.setDragMode(QGraphicsView.NoDrag)
         self.setCursor(Qt.ArrowCursor)
 
     def _start_draw_preview(self, scene_pos: QPointF) -> None:
@@ -277,7 +336,7 @@ class CoffeeBoard(QGraphicsView):
         shape_type = self._draw_mode
         self._draw_mode = None
         self._draw_start_scene = None
-        self.setDragMode(QGraphicsView.RubberBandDrag)
+        self.setDragMode(QGraphicsView.NoDrag)
         self.setCursor(Qt.ArrowCursor)
 
         if shape_type in ('line', 'arrow'):
@@ -297,6 +356,7 @@ class CoffeeBoard(QGraphicsView):
         from CoffeeBoard.core.undo_commands import AddItemCommand
         cmd = AddItemCommand(self, item, self.shape_items)
         self.undo_stack.push(cmd)
+        self._grow_scene_rect([item])
 
         self.scene.clearSelection()
         item.setSelected(True)
@@ -387,13 +447,13 @@ class CoffeeBoard(QGraphicsView):
 
             all_paths = [url.toLocalFile() for url in event.mimeData().urls()]
 
-            # If any .json file is dropped, treat it as a board load and ignore image files.
-            json_files = [p for p in all_paths if os.path.splitext(p)[1].lower() == ".json"]
+            # If any board file is dropped, treat it as a board load and ignore image files.
+            json_files = [p for p in all_paths if os.path.splitext(p)[1].lower() in (".json", ".board")]
             if json_files:
                 json_path = json_files[0]
                 try:
-                    with open(json_path, 'r') as f:
-                        data = json.load(f)
+                    from CoffeeBoard.core.board_file import read_board_file
+                    data = read_board_file(json_path)
                     if "items" not in data and "images" not in data:
                         self.bridge.show_message(
                             f"Not a valid CoffeeBoard file:\n{json_path}"
@@ -401,19 +461,19 @@ class CoffeeBoard(QGraphicsView):
                         return
                 except Exception as e:
                     self.bridge.show_message(
-                        f"Could not read JSON file:\n{json_path}\n\nError: {e}"
+                        f"Could not read board file:\n{json_path}\n\nError: {e}"
                     )
                     return
                 self.load_board(json_path)
                 return
 
-            files_to_load = []
+            files_to_load = []  # [(path, lowercased ext), ...] — each path split once
             for path in all_paths:
                 ext = os.path.splitext(path)[1].lower()
-                if ext in [".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".exr"]:
-                    files_to_load.append(path)
+                if ext in SUPPORTED_EXTS:
+                    files_to_load.append((path, ext))
                 else:
-                    self.bridge.show_message(f"Unsupported file type dropped:\n{path}\n\nOnly supports JPG, PNG, EXR, TIFF, BMP.")
+                    self.bridge.show_message(_UNSUPPORTED_MSG.format(path))
 
             if not files_to_load:
                 event.ignore()
@@ -422,8 +482,7 @@ class CoffeeBoard(QGraphicsView):
             total_files = len(files_to_load)
 
             # Check if we have multiple EXRs
-            exr_files = [f for f in files_to_load if f.lower().endswith('.exr')]
-            has_multiple_exrs = len(exr_files) > 1
+            has_multiple_exrs = sum(1 for _, ext in files_to_load if ext == '.exr') > 1
 
             # --- Phase 1: collect import settings ---
             # All EXR layer dialogs are shown here, before the progress window
@@ -433,11 +492,13 @@ class CoffeeBoard(QGraphicsView):
             batch_format = None
             file_load_queue = []  # [(path, layer, fmt), ...]
 
-            for path in files_to_load:
-                ext = os.path.splitext(path)[1].lower()
+            for path, ext in files_to_load:
                 if ext == '.exr':
-                    if apply_to_all and batch_layer and batch_format:
-                        file_load_queue.append((path, batch_layer, batch_format))
+                    if apply_to_all:
+                        # No dialog for the rest of the batch; files without the
+                        # chosen layer get their default 'rgba' instead
+                        layer = batch_layer if batch_layer in self._read_exr_layers(path) else 'rgba'
+                        file_load_queue.append((path, layer, batch_format))
                     else:
                         layer, fmt, apply_all = self._prompt_for_layer(path, is_batch=has_multiple_exrs)
                         if layer is None:
@@ -459,21 +520,28 @@ class CoffeeBoard(QGraphicsView):
             progress.setMessage("Starting import...")
 
             try:
-                if total_queued > 10:
-                    self.setUpdatesEnabled(False)
+                # Suspend repaints and BSP index maintenance for the whole batch;
+                # the index is rebuilt once when restored below.
+                self.setUpdatesEnabled(False)
+                self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
 
                 loaded_count = 0
+                last_ui_update = 0.0
 
                 for idx, (path, layer, fmt) in enumerate(file_load_queue):
                     if progress.isCancelled():
                         print(f"Import cancelled by user. Loaded {loaded_count} of {total_queued} images.")
                         break
 
-                    progress.setProgress(int((idx / float(total_queued)) * 100))
-                    progress.setMessage(f"Loading {idx + 1} of {total_queued}: {os.path.basename(path)}")
+                    # Progress repaints can cost more than a small load — cap at ~60 Hz
+                    now = time.monotonic()
+                    if now - last_ui_update > _PROGRESS_INTERVAL or idx == total_queued - 1:
+                        progress.setProgress(int((idx / float(total_queued)) * 100))
+                        progress.setMessage(f"Loading {idx + 1} of {total_queued}: {os.path.basename(path)}")
+                        last_ui_update = now
 
                     try:
-                        self.add_image(path, layer=layer, preview_format=fmt)
+                        self.add_image(path, layer=layer, preview_format=fmt, defer_layout=True)
                         loaded_count += 1
                     except Exception as e:
                         print(f"Failed to load {path}: {e}")
@@ -484,33 +552,50 @@ class CoffeeBoard(QGraphicsView):
 
             finally:
                 del progress
-                if total_queued > 10:
-                    self.setUpdatesEnabled(True)
+                self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+                self.setUpdatesEnabled(True)
 
-            # Layout all images at once
+            # Layout all images and refresh the item list once for the whole batch
             self._layout_images()
+            self._grow_scene_rect()
+            self._item_list_panel.refresh()
         else:
             event.ignore()
 
     def wheelEvent(self, event: QWheelEvent) -> None:
-        """Handles zooming in and out of the view using the mouse wheel.
+        """Accumulates mouse wheel ticks; the zoom itself is applied in _apply_zoom.
+
+        A single physical scroll can deliver many wheel events. Each one only
+        records a step here, and the timer applies the compound zoom once.
 
         Args:
             event (QWheelEvent): The event object containing the wheel movement data.
         """
+        dy = event.angleDelta().y()
+        if dy:
+            self._pending_zoom_steps += 1 if dy > 0 else -1
+            # PySide6 removed QWheelEvent.pos() — use position() which exists in both Qt5.14+ and Qt6
+            self._pending_zoom_pos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
+            self._wheel_timer.start()
+        event.accept()
+
+    def _apply_zoom(self) -> None:
+        """Applies the accumulated wheel steps as one scale around the cursor."""
+        steps = self._pending_zoom_steps
+        self._pending_zoom_steps = 0
+        if not steps:
+            return
+
         # Zoom with smooth scaling
-        zoom_in_factor = 1.15
-        zoom_out_factor = 1 / zoom_in_factor
+        zoom_factor = 1.15 ** steps
 
-        # PySide6 removed QWheelEvent.pos() — use position() which exists in both Qt5.14+ and Qt6
-        epos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
-        old_pos = self.mapToScene(epos)
+        # Already clamped in this direction — nothing to scale or translate
+        if ((zoom_factor > 1.0 and self.scale_factor >= self.max_scale) or
+                (zoom_factor < 1.0 and self.scale_factor <= self.min_scale)):
+            return
 
-        # Determine zoom factor
-        if event.angleDelta().y() > 0:
-            zoom_factor = zoom_in_factor
-        else:
-            zoom_factor = zoom_out_factor
+        epos = self._pending_zoom_pos
+        old_pos = self.mapToScene(epos)
 
         # Apply scaling around the mouse position
         self.scale(zoom_factor, zoom_factor)
@@ -527,6 +612,7 @@ class CoffeeBoard(QGraphicsView):
             correction = self.max_scale / self.scale_factor
             self.scale(correction, correction)
             self.scale_factor = self.max_scale
+        self._inv_scale_factor = 1.0 / self.scale_factor
 
         new_pos = self.mapToScene(epos)
 
@@ -535,7 +621,7 @@ class CoffeeBoard(QGraphicsView):
         self.translate(delta.x(), delta.y())
 
         # Resize handles on selected items so they stay ~12px on screen
-        for item in self.scene.selectedItems():
+        for item in self._selected_items:
             if hasattr(item, 'update_handles'):
                 item.update_handles()
 
@@ -570,6 +656,10 @@ class CoffeeBoard(QGraphicsView):
                 self.scene.clearSelection()
                 self._settings_panel.hide_panel()
                 self._text_settings_panel.hide_panel()
+                # Box-select for this drag only. The rubber band sweeps a large
+                # area — full updates avoid trailing artifacts.
+                self.setDragMode(QGraphicsView.RubberBandDrag)
+                self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
                 super().mousePressEvent(event)
             elif modifiers & Qt.ShiftModifier and not (modifiers & Qt.ControlModifier):
                 # Treat Shift+click as Ctrl+click: toggle individual item selection
@@ -605,8 +695,8 @@ class CoffeeBoard(QGraphicsView):
             self.pan_origin = event.pos()
 
             # Just translate directly with the sensitivity factor
-            self.translate(delta.x() / self.scale_factor,
-                         delta.y() / self.scale_factor)
+            inv = self._inv_scale_factor
+            self.translate(delta.x() * inv, delta.y() * inv)
 
             event.accept()
         else:
@@ -628,6 +718,13 @@ class CoffeeBoard(QGraphicsView):
             event.accept()
         else:
             super().mouseReleaseEvent(event)
+            if event.button() == Qt.LeftButton:
+                # Restore after super() so Qt can finish the rubber-band selection
+                self.setDragMode(QGraphicsView.NoDrag)
+                self.setViewportUpdateMode(self._idle_update_mode)
+                # Items may have been dragged or resized past the scene rect
+                if self._selected_items:
+                    self._grow_scene_rect(self._selected_items)
 
     def leaveEvent(self, event: QEvent) -> None:
         """Handles the event when the mouse cursor leaves the view's widget area.
@@ -662,26 +759,10 @@ class CoffeeBoard(QGraphicsView):
         if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
             # If a TextItem is currently being edited, let the key pass to the text editor
             if any(isinstance(i, TextItem) and getattr(i, '_in_edit_mode', False)
-                   for i in self.scene.selectedItems()):
+                   for i in self._selected_items):
                 super().keyPressEvent(event)
                 return
-            from CoffeeBoard.core.undo_commands import DeleteItemCommand
-            for item in self.scene.selectedItems():
-                if isinstance(item, ImageDisplay):
-                    if item is self._settings_panel._image:
-                        self._settings_panel.hide_panel()
-                    cmd = DeleteItemCommand(self, item, self.image_items)
-                    self.undo_stack.push(cmd)
-                elif isinstance(item, TextItem):
-                    if item is self._text_settings_panel._item:
-                        self._text_settings_panel.hide_panel()
-                    cmd = DeleteItemCommand(self, item, self.text_items)
-                    self.undo_stack.push(cmd)
-                elif isinstance(item, ShapeItem):
-                    if item is self._shape_settings_panel._item:
-                        self._shape_settings_panel.hide_panel()
-                    cmd = DeleteItemCommand(self, item, self.shape_items)
-                    self.undo_stack.push(cmd)
+            self.delete_selected_images()
         elif event.key() == Qt.Key_Escape:
             if self._draw_mode is not None:
                 self._cancel_draw()
@@ -738,13 +819,12 @@ class CoffeeBoard(QGraphicsView):
                 candidate = candidate.parentItem()
 
         if clicked_image:
-            selected_images = [i for i in self.scene.selectedItems() if isinstance(i, ImageDisplay)]
-            if clicked_image not in selected_images:
-                for si in selected_images:
+            if clicked_image not in self._selected_image_items:
+                for si in self._selected_image_items:
                     si.setSelected(False)
                 clicked_image.setSelected(True)
 
-        selected_images = [i for i in self.scene.selectedItems() if isinstance(i, ImageDisplay)]
+        selected_images = self._selected_image_items
         show_image_menu = bool(selected_images) or clicked_image is not None
 
         # --- TextItem context menu ---
@@ -805,9 +885,7 @@ class CoffeeBoard(QGraphicsView):
         elif show_image_menu:
             if len(selected_images) > 1:
                 menu.addSection(f"{len(selected_images)} images selected")
-            resize_menu = menu.addMenu("Resize")
-            for act in self.resize_actions:
-                resize_menu.addAction(act)
+            menu.addMenu(self._resize_submenu)
             menu.addSeparator()
 
             menu.addAction(self.bring_front_action)
@@ -873,31 +951,54 @@ class CoffeeBoard(QGraphicsView):
 
     def _layout_images(self) -> None:
         """Arranges all currently tracked image items in a grid layout."""
-        x, y = 0.0, 0.0
-        max_row_height = 0.0
         spacing = 10.0
+        columns = self.columns
 
-        if not self.image_items:
+        items = self.image_items
+        n = len(items)
+        if n == 0:
             return
 
-        for i, item in enumerate(self.image_items):
-            item_width = item.boundingRect().width()
-            item_height = item.boundingRect().height()
+        # Grid offsets are computed in one vectorized pass; only setPos stays per-item
+        rects = [item.boundingRect() for item in items]
+        w = np.fromiter((r.width() for r in rects), dtype=np.float64, count=n)
+        h = np.fromiter((r.height() for r in rects), dtype=np.float64, count=n)
+
+        rows = (n + columns - 1) // columns
+        pad = rows * columns - n
+        w = np.pad(w, (0, pad)).reshape(rows, columns)
+        h = np.pad(h, (0, pad)).reshape(rows, columns)
+
+        # Exclusive prefix sums: x of each cell in its row, y of each row
+        xs = np.cumsum(w + spacing, axis=1) - (w + spacing)
+        row_heights = h.max(axis=1)
+        ys = np.cumsum(row_heights + spacing) - (row_heights + spacing)
 
+        xs = xs.ravel()[:n].tolist()
+        ys = np.repeat(ys, columns)[:n].tolist()
+        for item, x, y in zip(items, xs, ys):
             item.setPos(x, y)
-            x += item_width + spacing
-            max_row_height = max(max_row_height, item_height)
 
-            if (i + 1) % self.columns == 0:
-                y += max_row_height + spacing
-                x = 0.0
-                max_row_height = 0.0
+    def _read_exr_layers(self, path: str) -> List[str]:
+        """Returns the EXR layer list for path, memoized by (path, mtime).
 
+        Render sequences and repeated drops hit the same headers over and over;
+        the mtime in the key invalidates entries when a file is re-rendered.
+        """
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return get_exr_layers(path)
+        layers = self._exr_layer_cache.get(key)
+        if layers is None:
+            layers = get_exr_layers(path)
+            self._exr_layer_cache[key] = layers
+        return layers
 
     def _prompt_for_layer(self, path: str, is_batch: bool = False) -> Tuple[str | None, str | None, bool]:
         """Prompts the user to select the layer and preview format for an EXR file.
 
-        Uses get_exr_layers() from image_loader for layer discovery.
+        Uses _read_exr_layers() (cached get_exr_layers()) for layer discovery.
 
         Args:
             path (str): The full file path to the EXR image.
@@ -907,7 +1008,7 @@ class CoffeeBoard(QGraphicsView):
         Returns:
             Tuple[str | None, str | None, bool]: (layer, format, apply_to_all).
         """
-        layer_list = get_exr_layers(path)
+        layer_list = self._read_exr_layers(path)
 
         if not layer_list:
             return ('rgba', self.preview_format, False)
@@ -926,28 +1027,41 @@ class CoffeeBoard(QGraphicsView):
             return (None, None, False)
 
 
-    def add_image(self, path: str, layer: str = 'rgba', preview_format: str = 'jpg') -> None:
+    def add_image(self, path: str, layer: str = 'rgba', preview_format: str = 'jpg',
+                  defer_layout: bool = False) -> None:
         """Adds a new ImageDisplay item to the board.
 
         Args:
             path (str): The full file path to the image.
             layer (str, optional): The specific layer to load for EXR files. Defaults to 'rgba'.
             preview_format (str, optional): The default file extension for consolidation. Defaults to 'jpg'.
+            defer_layout (bool, optional): If True, skip the per-add item list refresh; the
+                                           caller runs _layout_images() and refresh() once
+                                           after a batch. Defaults to False.
 
         Raises:
             IOError: If the specified file path does not exist.
         """
-        # Check if file exists
-        if not os.path.exists(path):
-            raise IOError(f"File does not exist: {path}")
-
-        print(f"Loading {path} with layer: {layer}, format: {preview_format}")
-
         try:
-            image_item = ImageDisplay(path, layer, preview_format)
+            # Files with a readable header decode on the thread pool behind a
+            # gray box of the final size, so layout can run right away. The rest
+            # load synchronously; the loader only checks for a missing file
+            # once every tier has failed.
+            src = source_size(path)
+            if src is not None:
+                size = decoded_size(path, src)
+                image_item = ImageDisplay.create_placeholder(
+                    path, layer, preview_format, size, size[0] / src[0])
+            else:
+                try:
+                    image_item = ImageDisplay(path, layer, preview_format)
+                except FileNotFoundError:
+                    raise IOError(f"File does not exist: {path}") from None
             from CoffeeBoard.core.undo_commands import AddItemCommand
             cmd = AddItemCommand(self, image_item, self.image_items)
-            self.undo_stack.push(cmd)
+            self.undo_stack.push(cmd, notify=not defer_layout)
+            if image_item._loading:
+                image_item.load_async()
         except Exception as e:
             print(f"Failed to add image {path}: {e}")
             raise
@@ -962,11 +1076,9 @@ class CoffeeBoard(QGraphicsView):
             # Get image from clipboard
             image = clipboard.image()
             if not image.isNull():
-                # Convert to pixmap
-                pixmap = QPixmap.fromImage(image)
-
-                # Create ImageDisplay item
-                image_item = ImageDisplay(pixmap)
+                # Hand over the QImage itself: ImageDisplay builds the pixmap and
+                # feeds the same CPU buffer to its background float32 job
+                image_item = ImageDisplay(image)
 
                 # Position at view center
                 view_center = self.mapToScene(self.viewport().rect().center())
@@ -975,6 +1087,7 @@ class CoffeeBoard(QGraphicsView):
                 from CoffeeBoard.core.undo_commands import AddItemCommand
                 cmd = AddItemCommand(self, image_item, self.image_items)
                 self.undo_stack.push(cmd)
+                self._grow_scene_rect([image_item])
         else:
             self.bridge.show_message("No image data found in clipboard.")
 
@@ -987,6 +1100,7 @@ class CoffeeBoard(QGraphicsView):
         item.setPos(self._last_context_pos - QPointF(w / 2, h / 2))
         cmd = AddItemCommand(self, item, self.text_items)
         self.undo_stack.push(cmd)
+        self._grow_scene_rect([item])
         self.scene.clearSelection()
         item.setSelected(True)
         item.enter_edit_mode()
@@ -997,48 +1111,36 @@ class CoffeeBoard(QGraphicsView):
         Args:
             scale (float): The multiplicative factor for image size.
         """
-        for item in self.scene.selectedItems():
-            if isinstance(item, ImageDisplay):
-                item.resize_image(scale)
+        for item in self._selected_image_items:
+            item.resize_image(scale)
 
     def bring_to_front(self) -> None:
         """Brings all currently selected items to the foreground."""
-        selected_items = [i for i in self.scene.selectedItems()
-                          if isinstance(i, (ImageDisplay, TextItem, ShapeItem))]
+        selected_items = self._selected_board_items
         if not selected_items:
             return
 
-        all_items = self.image_items + self.text_items + self.shape_items
-        if not all_items:
-            return
-        max_z = max(item.zValue() for item in all_items)
-
+        self._max_z += 1
         for item in selected_items:
-            item.setZValue(max_z + 1)
+            item.setZValue(self._max_z)
 
         self._item_list_panel.refresh()
 
     def send_to_back(self) -> None:
         """Sends all currently selected items to the background."""
-        selected_items = [i for i in self.scene.selectedItems()
-                          if isinstance(i, (ImageDisplay, TextItem, ShapeItem))]
+        selected_items = self._selected_board_items
         if not selected_items:
             return
 
-        all_items = self.image_items + self.text_items + self.shape_items
-        if not all_items:
-            return
-        min_z = min(item.zValue() for item in all_items)
-
+        self._min_z -= 1
         for item in selected_items:
-            item.setZValue(min_z - 1)
+            item.setZValue(self._min_z)
 
         self._item_list_panel.refresh()
 
     def move_forward_one(self) -> None:
         from CoffeeBoard.core.undo_commands import ZOrderCommand
-        selected_items = [i for i in self.scene.selectedItems()
-                          if isinstance(i, (ImageDisplay, TextItem, ShapeItem))]
+        selected_items = self._selected_board_items
         if not selected_items:
             return
         all_items = self.image_items + self.text_items + self.shape_items
@@ -1064,14 +1166,14 @@ class CoffeeBoard(QGraphicsView):
             return
         for new_z, i in enumerate(sorted_items):
             i.setZValue(float(new_z))
+        self.note_z_range(0.0, float(len(sorted_items) - 1))
         after = [(i, i.zValue()) for i in all_items]
         self.undo_stack.push(ZOrderCommand(before, after))
         self._item_list_panel.refresh()
 
     def move_backward_one(self) -> None:
         from CoffeeBoard.core.undo_commands import ZOrderCommand
-        selected_items = [i for i in self.scene.selectedItems()
-                          if isinstance(i, (ImageDisplay, TextItem, ShapeItem))]
+        selected_items = self._selected_board_items
         if not selected_items:
             return
         all_items = self.image_items + self.text_items + self.shape_items
@@ -1097,6 +1199,7 @@ class CoffeeBoard(QGraphicsView):
             return
         for new_z, i in enumerate(sorted_items):
             i.setZValue(float(new_z))
+        self.note_z_range(0.0, float(len(sorted_items) - 1))
         after = [(i, i.zValue()) for i in all_items]
         self.undo_stack.push(ZOrderCommand(before, after))
         self._item_list_panel.refresh()
@@ -1117,24 +1220,29 @@ class CoffeeBoard(QGraphicsView):
                 break
 
     def delete_selected_images(self) -> None:
-        """Removes all currently selected items from the board."""
-        from CoffeeBoard.core.undo_commands import DeleteItemCommand
-        for item in list(self.scene.selectedItems()):
+        """Removes all currently selected items from the board as one undo step."""
+        from CoffeeBoard.core.undo_commands import DeleteItemsCommand
+        images, texts, shapes = [], [], []
+        for item in self._selected_items:
             if isinstance(item, ImageDisplay):
                 if item is self._settings_panel._image:
                     self._settings_panel.hide_panel()
-                cmd = DeleteItemCommand(self, item, self.image_items)
-                self.undo_stack.push(cmd)
+                images.append(item)
             elif isinstance(item, TextItem):
                 if item is self._text_settings_panel._item:
                     self._text_settings_panel.hide_panel()
-                cmd = DeleteItemCommand(self, item, self.text_items)
-                self.undo_stack.push(cmd)
+                texts.append(item)
             elif isinstance(item, ShapeItem):
                 if item is self._shape_settings_panel._item:
                     self._shape_settings_panel.hide_panel()
-                cmd = DeleteItemCommand(self, item, self.shape_items)
-                self.undo_stack.push(cmd)
+                shapes.append(item)
+        if not (images or texts or shapes):
+            return
+        self.undo_stack.push(DeleteItemsCommand(self, [
+            (self.image_items, images),
+            (self.text_items, texts),
+            (self.shape_items, shapes),
+        ]))
 
     def clear_all_images(self) -> None:
         """Removes all items from the scene and resets the board state."""
@@ -1151,9 +1259,46 @@ class CoffeeBoard(QGraphicsView):
             self.scene.removeItem(item)
         self.shape_items.clear()
         self.current_save_path = None
-        self.scene.setSceneRect(QRectF(0, 0, 800, 600))
+        self._max_z = self._min_z = 0.0
+        self.scene.setSceneRect(_BASE_SCENE_RECT)
         self._item_list_panel.refresh()
 
+    def _note_z(self, z: float) -> None:
+        """Widens the cached z bounds to include z; call after setting an item's zValue directly.
+
+        Undo only restores values that were already inside the bounds, so it needs no call.
+        """
+        if z > self._max_z:
+            self._max_z = z
+        if z < self._min_z:
+            self._min_z = z
+
+    def note_z_range(self, lo: float, hi: float) -> None:
+        """Widens the cached z bounds to include lo..hi, e.g. after renumbering every item's z."""
+        self._note_z(lo)
+        self._note_z(hi)
+
+    def _grow_scene_rect(self, items=None) -> None:
+        """Expands the scene rect so it covers items (default: all items) plus padding.
+
+        The rect only grows here; clear_all_images() resets it to the base size.
+        """
+        pad = _SCENE_RECT_PAD
+        rect = self.scene.sceneRect()
+        if items is None:
+            if not (self.image_items or self.text_items or self.shape_items):
+                return
+            needed = self.scene.itemsBoundingRect().adjusted(-pad, -pad, pad, pad)
+        else:
+            needed = QRectF()
+            for item in items:
+                needed = needed.united(item.sceneBoundingRect())
+            if needed.isNull():
+                return
+            needed.adjust(-pad, -pad, pad, pad)
+        if not rect.contains(needed):
+            self.scene.setSceneRect(rect.united(needed))
+
     def fit_all_to_view(self) -> None:
         """Resets the view transform and scales it to fit all items within the viewport."""
         if not self.image_items and not self.text_items and not self.shape_items:
@@ -1163,15 +1308,12 @@ class CoffeeBoard(QGraphicsView):
         self.resetTransform()
         self.scale_factor = 1.0
 
-        # Fit the scene rect in view
+        # Fit the items in view
         self.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
 
-        # Restore huge scene rect so panning is not locked to content bounds
-        SCENE_SIZE = 1000000
-        self.scene.setSceneRect(QRectF(-SCENE_SIZE, -SCENE_SIZE, 2 * SCENE_SIZE, 2 * SCENE_SIZE))
-
         # Update scale factor and force repaint
         self.scale_factor = self.transform().m11()
+        self._inv_scale_factor = 1.0 / self.scale_factor
         self.viewport().update()
 
     def save_board(self) -> None:
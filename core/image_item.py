@@ -3,7 +3,11 @@ from __future__ import annotations
 import os
 import math
 import enum
-from typing import Union, Any, Optional
+from typing import Union, Any, Optional, Tuple
+
+
+# Extensions assumed sRGB when the file carries no colorspace metadata
+_SRGB_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp'})
 
 
 def _detect_file_colorspace(path: str) -> str:
@@ -28,7 +32,7 @@ def _detect_file_colorspace(path: str) -> str:
                 return 'srgb'
     except Exception:
         pass
-    if ext in ('.jpg', '.jpeg', '.png', '.bmp'):
+    if ext in _SRGB_EXTS:
         return 'srgb'
     return 'linear'
 
@@ -36,11 +40,11 @@ from CoffeeBoard.ui.platform_bridge import get_bridge
 
 try:
     from PySide2.QtCore import Qt, QPointF, QRectF
-    from PySide2.QtGui import QPixmap, QBrush, QColor, QPen, QPainter, QMouseEvent, QImage
+    from PySide2.QtGui import QPixmap, QBrush, QColor, QPen, QPainter, QMouseEvent, QImage, QTransform
     from PySide2.QtWidgets import QGraphicsPixmapItem, QGraphicsItem, QGraphicsEllipseItem, QGraphicsRectItem
 except ImportError:
     from PySide6.QtCore import Qt, QPointF, QRectF
-    from PySide6.QtGui import QPixmap, QBrush, QColor, QPen, QPainter, QMouseEvent, QImage
+    from PySide6.QtGui import QPixmap, QBrush, QColor, QPen, QPainter, QMouseEvent, QImage, QTransform
     from PySide6.QtWidgets import QGraphicsPixmapItem, QGraphicsItem, QGraphicsEllipseItem, QGraphicsRectItem
 
 # Kontrollera om QImage stödjer 16-bit RGBA (Qt 5.12+)
@@ -51,6 +55,32 @@ NukeNode = Any
 NukeKnob = Any
 
 _ROFF = 22.0 / math.sqrt(2.0)
+_BORDER_WIDTH = 1.5
+
+
+def _loading_pixmap(width: float, height: float) -> QPixmap:
+    """Gray stand-in shown while an image decodes in the background."""
+    pixmap = QPixmap(max(1, int(round(width))), max(1, int(round(height))))
+    pixmap.fill(QColor(60, 60, 60))
+    return pixmap
+
+
+def _cap_clipboard_source(source: Union[QPixmap, QImage]) -> Union[QPixmap, QImage]:
+    """Scale an in-memory image down once so its long edge is <= DECODE_MAX_EDGE."""
+    from CoffeeBoard.core.image_loader import DECODE_MAX_EDGE
+    if max(source.width(), source.height()) <= DECODE_MAX_EDGE:
+        return source
+    return source.scaled(DECODE_MAX_EDGE, DECODE_MAX_EDGE,
+                         Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _qimage_to_linear(qimg: QImage):
+    """Promote an 8-bit QImage to a float32 (H, W, 4) array. Safe on worker threads."""
+    import numpy as np
+    qimg = qimg.convertToFormat(QImage.Format_RGBA8888)
+    ptr = qimg.constBits()
+    arr = np.frombuffer(ptr, dtype=np.uint8).reshape(qimg.height(), qimg.width(), 4).copy()
+    return arr.astype(np.float32) / 255.0
 
 
 class HandlePos(enum.IntEnum):
@@ -67,17 +97,11 @@ def _get_view_scale(item) -> float:
     return 1.0
 
 
-def _rotate_vec(v: QPointF, angle_deg: float) -> QPointF:
-    rad = math.radians(angle_deg)
-    c, s = math.cos(rad), math.sin(rad)
-    return QPointF(v.x() * c - v.y() * s, v.x() * s + v.y() * c)
-
-
 class _SelectionBorder(QGraphicsRectItem):
     def __init__(self, parent_image: 'ImageDisplay') -> None:
         super().__init__(0, 0, 0, 0, parent_image)
         self.setBrush(QBrush(Qt.NoBrush))
-        self.setPen(QPen(QColor(0, 200, 180, 220), 1.5))
+        self.setPen(QPen(QColor(0, 200, 180, 220), _BORDER_WIDTH))
         self.setZValue(999)
         self.setVisible(False)
         self.setFlag(QGraphicsItem.ItemIsMovable, False)
@@ -127,6 +151,11 @@ class _Handle(QGraphicsRectItem):
             self._anchor_BM = item.mapToScene(QPointF(orig_w * s / 2, orig_h * s))
             self._anchor_LM = item.mapToScene(QPointF(0, orig_h * s / 2))
             self._anchor_RM = item.mapToScene(QPointF(orig_w * s, orig_h * s / 2))
+            # Fixed for the whole drag — the drag only rescales and moves the item
+            self._drag_diag_sq = (orig_w * s) ** 2 + (orig_h * s) ** 2
+            self._drag_size = (orig_w, orig_h)
+            rad = math.radians(item.rotation())
+            self._drag_cos, self._drag_sin = math.cos(rad), math.sin(rad)
             event.accept()
 
     def mouseMoveEvent(self, event):
@@ -148,62 +177,63 @@ class _Handle(QGraphicsRectItem):
                         self._drag_start_scale, new_scale,
                         self._drag_start_pos, new_pos
                     ))
+            # ResizeCommand.redo() already re-rendered; this covers no-op
+            # drags and views without an undo stack
+            if self.parent_image._baked_scale != new_scale:
+                self.parent_image.resize_image(new_scale)
+            else:
+                self.parent_image.end_preview()  # back at the rendered size
             event.accept()
 
+    def _corner_scale(self, anchor: QPointF, mouse_scene: QPointF) -> float:
+        """Scale at which the start diagonal reaches from anchor to the mouse."""
+        s = self._drag_start_scale
+        if self._drag_diag_sq <= 0:
+            return s
+        dx = mouse_scene.x() - anchor.x()
+        dy = mouse_scene.y() - anchor.y()
+        # One sqrt of the squared ratio instead of a hypot per length
+        new_scale = math.sqrt((dx * dx + dy * dy) / self._drag_diag_sq) * s
+        return max(0.05, min(20.0, new_scale))
+
     def _apply_resize(self, mouse_scene: QPointF):
         item = self.parent_image
         s = self._drag_start_scale
-        orig_w = item.base_width()
-        orig_h = item.base_height()
+        orig_w, orig_h = self._drag_size
+        c, sn = self._drag_cos, self._drag_sin
         hp = self.handle_pos
-        rotation = item.rotation()
 
         if hp == HandlePos.BR:
             anchor = self._anchor_TL
-            orig_diag = math.hypot(orig_w * s, orig_h * s)
-            dist = math.hypot(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            new_scale = (dist / orig_diag) * s if orig_diag > 0 else s
-            new_scale = max(0.05, min(20.0, new_scale))
+            new_scale = self._corner_scale(anchor, mouse_scene)
             w_new = orig_w * new_scale
             h_new = orig_h * new_scale
             anchor_local_new = QPointF(0, 0)
 
         elif hp == HandlePos.BL:
             anchor = self._anchor_TR
-            orig_diag = math.hypot(orig_w * s, orig_h * s)
-            dist = math.hypot(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            new_scale = (dist / orig_diag) * s if orig_diag > 0 else s
-            new_scale = max(0.05, min(20.0, new_scale))
+            new_scale = self._corner_scale(anchor, mouse_scene)
             w_new = orig_w * new_scale
             h_new = orig_h * new_scale
             anchor_local_new = QPointF(w_new, 0)
 
         elif hp == HandlePos.TR:
             anchor = self._anchor_BL
-            orig_diag = math.hypot(orig_w * s, orig_h * s)
-            dist = math.hypot(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            new_scale = (dist / orig_diag) * s if orig_diag > 0 else s
-            new_scale = max(0.05, min(20.0, new_scale))
+            new_scale = self._corner_scale(anchor, mouse_scene)
             w_new = orig_w * new_scale
             h_new = orig_h * new_scale
             anchor_local_new = QPointF(0, h_new)
 
         elif hp == HandlePos.TL:
             anchor = self._anchor_BR
-            orig_diag = math.hypot(orig_w * s, orig_h * s)
-            dist = math.hypot(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            new_scale = (dist / orig_diag) * s if orig_diag > 0 else s
-            new_scale = max(0.05, min(20.0, new_scale))
+            new_scale = self._corner_scale(anchor, mouse_scene)
             w_new = orig_w * new_scale
             h_new = orig_h * new_scale
             anchor_local_new = QPointF(w_new, h_new)
 
         elif hp == HandlePos.RM:
             anchor = self._anchor_LM
-            diff = QPointF(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            rad = math.radians(rotation)
-            right_axis = QPointF(math.cos(rad), math.sin(rad))
-            proj = diff.x() * right_axis.x() + diff.y() * right_axis.y()
+            proj = (mouse_scene.x() - anchor.x()) * c + (mouse_scene.y() - anchor.y()) * sn
             new_scale = abs(proj) / orig_w if orig_w > 0 else s
             new_scale = max(0.05, min(20.0, new_scale))
             w_new = orig_w * new_scale
@@ -212,10 +242,7 @@ class _Handle(QGraphicsRectItem):
 
         elif hp == HandlePos.LM:
             anchor = self._anchor_RM
-            diff = QPointF(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            rad = math.radians(rotation)
-            right_axis = QPointF(math.cos(rad), math.sin(rad))
-            proj = diff.x() * right_axis.x() + diff.y() * right_axis.y()
+            proj = (mouse_scene.x() - anchor.x()) * c + (mouse_scene.y() - anchor.y()) * sn
             new_scale = abs(proj) / orig_w if orig_w > 0 else s
             new_scale = max(0.05, min(20.0, new_scale))
             w_new = orig_w * new_scale
@@ -224,10 +251,7 @@ class _Handle(QGraphicsRectItem):
 
         elif hp == HandlePos.BM:
             anchor = self._anchor_TM
-            diff = QPointF(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            rad = math.radians(rotation)
-            down_axis = QPointF(-math.sin(rad), math.cos(rad))
-            proj = diff.x() * down_axis.x() + diff.y() * down_axis.y()
+            proj = (mouse_scene.y() - anchor.y()) * c - (mouse_scene.x() - anchor.x()) * sn
             new_scale = abs(proj) / orig_h if orig_h > 0 else s
             new_scale = max(0.05, min(20.0, new_scale))
             w_new = orig_w * new_scale
@@ -236,10 +260,7 @@ class _Handle(QGraphicsRectItem):
 
         elif hp == HandlePos.TM:
             anchor = self._anchor_BM
-            diff = QPointF(mouse_scene.x() - anchor.x(), mouse_scene.y() - anchor.y())
-            rad = math.radians(rotation)
-            down_axis = QPointF(-math.sin(rad), math.cos(rad))
-            proj = diff.x() * down_axis.x() + diff.y() * down_axis.y()
+            proj = (mouse_scene.y() - anchor.y()) * c - (mouse_scene.x() - anchor.x()) * sn
             new_scale = abs(proj) / orig_h if orig_h > 0 else s
             new_scale = max(0.05, min(20.0, new_scale))
             w_new = orig_w * new_scale
@@ -251,18 +272,14 @@ class _Handle(QGraphicsRectItem):
 
         # anchor_scene = new_pos + rotate(anchor_local_new - origin_new, R) + origin_new
         # → new_pos = anchor_scene - origin_new - rotate(anchor_local_new - origin_new, R)
-        origin_new = QPointF(orig_w * new_scale / 2, orig_h * new_scale / 2)
-        item.resize_item(new_scale)
-        rotated = _rotate_vec(
-            QPointF(anchor_local_new.x() - origin_new.x(),
-                    anchor_local_new.y() - origin_new.y()),
-            rotation
-        )
-        new_pos = QPointF(
-            anchor.x() - origin_new.x() - rotated.x(),
-            anchor.y() - origin_new.y() - rotated.y()
-        )
-        item.setPos(new_pos)
+        # with origin_new = (ox, oy) and R taken from the cos/sin cached at press
+        ox, oy = orig_w * new_scale / 2, orig_h * new_scale / 2
+        item.preview_scale(new_scale)
+        vx, vy = anchor_local_new.x() - ox, anchor_local_new.y() - oy
+        item.setPos(QPointF(
+            anchor.x() - ox - (vx * c - vy * sn),
+            anchor.y() - oy - (vx * sn + vy * c)
+        ))
 
 
 class _RotationHandle(QGraphicsEllipseItem):
@@ -336,6 +353,10 @@ class ImageDisplay(QGraphicsPixmapItem):
         layer (str): The specific layer/channel loaded from the source file (e.g., 'rgba').
         original_pixmap (QPixmap): The unscaled version of the loaded image data.
         current_scale (float): The current scale factor applied to the pixmap (1.0 = original size).
+        decode_ratio (float): Source width / decoded pixmap width (> 1.0 when the loader
+                              downscaled a large photo). Board files store scale in source pixels.
+        clipboard_source (Union[QPixmap, QImage, None]): The uncapped pasted image, until
+                              save_board writes it out; None for file-backed items.
     """
 
     # --- ATTRIBUTE TYPE HINTS ---
@@ -343,6 +364,10 @@ class ImageDisplay(QGraphicsPixmapItem):
     layer: str
     original_pixmap: QPixmap
     current_scale: float
+    decode_ratio: float
+    clipboard_source: Union[QPixmap, QImage, None]
+    _ext: str  # lowercased source extension, split once at construction
+    _loading: bool  # True while a placeholder waits for load_async()
     linear_data: Any  # np.ndarray float32 eller None
     linear_data_preview: Any  # downscaled float32 for real-time preview, or None
     exposure: float
@@ -353,50 +378,70 @@ class ImageDisplay(QGraphicsPixmapItem):
     _display_buffer: Any  # numpy-referens för QImage GC-skydd
     # --------------------------
 
-    def __init__(self, source: Union[str, os.PathLike, QPixmap],
+    def __init__(self, source: Union[str, os.PathLike, QPixmap, QImage],
                  layer: str = 'rgba',
-                 preview_format: str = 'jpg') -> None:
+                 preview_format: str = 'jpg',
+                 placeholder_size: Optional[Tuple[float, float]] = None) -> None:
         """Initializes the image display item.
 
         Args:
-            source (Union[str, os.PathLike, QPixmap]): Either the file path to load
-                                                        or a pre-loaded QPixmap (e.g., from clipboard).
+            source (Union[str, os.PathLike, QPixmap, QImage]): Either the file path to load
+                                                                or a pre-loaded QPixmap/QImage (e.g., from clipboard).
             layer (str, optional): The layer to extract if the source is a multi-channel file
                                    (like EXR). Defaults to 'rgba'.
             preview_format (str, optional): Kept for JSON save/load backwards-compat.
                                             Defaults to 'jpg'.
+            placeholder_size (Optional[Tuple[float, float]]): For path sources, show a gray
+                                            box of this size instead of decoding; see
+                                            create_placeholder(). Defaults to None.
 
         Raises:
-            TypeError: If the source is neither a path nor a QPixmap.
+            TypeError: If the source is neither a path, a QPixmap nor a QImage.
         """
+        source_image = None  # CPU-side copy of in-memory sources, for the float32 job
+        self.clipboard_source = None
+        self._loading = False
         # If source is a path, load via tiered image_loader
         if isinstance(source, (str, bytes, os.PathLike)):
             self.path = source
+            self._ext = os.path.splitext(str(source))[1].lower()
             self.layer = layer
             self.preview_format = preview_format
-            pixmap = self._load_image_data(source, layer, preview_format)
-        # If source is already a QPixmap, use it directly
-        elif isinstance(source, QPixmap):
+            if placeholder_size is not None:
+                self._loading = True
+                self.linear_data = None
+                self.decode_ratio = 1.0
+                pixmap = _loading_pixmap(*placeholder_size)
+            else:
+                pixmap = self._load_image_data(source, layer, preview_format)
+        # If source is already a QPixmap/QImage, use it directly
+        elif isinstance(source, (QPixmap, QImage)):
             self.path = "clipboard_image"  # Placeholder path for clipboard images
+            self._ext = '.png'
             self.layer = 'rgba'  # Default layer for clipboard images
             self.preview_format = 'png'  # Clipboard images are always saved as PNG
-            pixmap = source
-            # Build float32 data so exposure/gamma controls work on clipboard images
-            try:
-                import numpy as np
-                qimg = pixmap.toImage().convertToFormat(QImage.Format_RGBA8888)
-                ptr = qimg.constBits()
-                arr = np.frombuffer(ptr, dtype=np.uint8).reshape(qimg.height(), qimg.width(), 4).copy()
-                self.linear_data = arr.astype(np.float32) / 255.0
-            except Exception:
-                pass
+            # Kept at full resolution so save_board writes the pasted pixels,
+            # not the capped display copy
+            self.clipboard_source = source
+            source = _cap_clipboard_source(source)
+            self.decode_ratio = self.clipboard_source.width() / source.width() if source.width() > 0 else 1.0
+            if isinstance(source, QImage):
+                # QImage is reentrant, so the worker reads it directly — no
+                # pixmap.toImage() read-back on the GUI thread
+                source_image = source
+                pixmap = QPixmap.fromImage(source)
+            else:
+                pixmap = source
         else:
-            raise TypeError(f"Expected str or QPixmap, got {type(source)}")
+            raise TypeError(f"Expected str, QPixmap or QImage, got {type(source)}")
 
         super().__init__(pixmap)
 
         self.original_pixmap = pixmap
         self.current_scale = 1.0
+        self._baked_scale = 1.0  # scale the displayed pixmap was rendered at
+        self._baked_key = (pixmap.cacheKey(), 1.0)  # (original_pixmap, scale) it came from
+        self._preview_mode = None  # transformationMode() that preview_scale() replaced
         self._init_handles()
 
         # HDR display transform-attribut
@@ -413,19 +458,22 @@ class ImageDisplay(QGraphicsPixmapItem):
 
         # Auto-detect colorspace for non-EXR file-based images.
         if self.path != 'clipboard_image':
-            ext = os.path.splitext(str(self.path))[1].lower()
-            if ext != '.exr':
+            if self._ext != '.exr':
                 self.colorspace = _detect_file_colorspace(str(self.path))
-                if self.linear_data is not None:
+                # Placeholders get the same defaults: 8-bit formats always decode with linear data
+                if self.linear_data is not None or self._loading:
                     self.tone_mapping = 'clamp'
                     self.gamma = 2.2
+                if self.linear_data is not None:
                     self._update_display_transform()
         else:
-            # Clipboard images are sRGB — set up so display controls work
-            if self.linear_data is not None:
-                self.colorspace = 'srgb'
-                self.tone_mapping = 'clamp'
-                self._make_preview_data()
+            # Build float32 data off the GUI thread so exposure/gamma controls
+            # work on clipboard images; installed by _on_clipboard_linear_ready.
+            from CoffeeBoard.core.workers import run_in_background
+            if source_image is None:
+                source_image = pixmap.toImage()
+            run_in_background(_qimage_to_linear, source_image,
+                              on_done=self._on_clipboard_linear_ready)
 
         # Configure item interaction flags
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
@@ -434,12 +482,103 @@ class ImageDisplay(QGraphicsPixmapItem):
         self.setAcceptHoverEvents(True)
         self._drag_start_pos = None
 
+        # Cache the rendered pixmap in device space so panning is a blit rather
+        # than a resample. Re-rendered once per zoom step.
+        self.setCacheMode(self.cache_mode)
+
+    # DeviceCoordinateCache invalidates on every zoom step; ItemCoordinateCache
+    # is the alternative for boards that zoom far more than they pan.
+    cache_mode = QGraphicsItem.DeviceCoordinateCache
+
+    @classmethod
+    def create_placeholder(cls, path: str, layer: str, preview_format: str,
+                           size: Tuple[float, float], source_scale: float) -> 'ImageDisplay':
+        """Creates an item that shows a gray box of size (scene units) until load_async() is done.
+
+        Args:
+            path (str): The file path to the image asset.
+            layer (str): The layer to extract for EXR files.
+            preview_format (str): Kept for JSON save/load backwards-compat.
+            size (Tuple[float, float]): On-canvas width and height to reserve.
+            source_scale (float): The board-file scale, relative to the source resolution.
+                                  Folded into decode_ratio so a save before the decode
+                                  finishes writes it back unchanged.
+
+        Returns:
+            ImageDisplay: The placeholder item, at current_scale 1.0.
+        """
+        item = cls(path, layer, preview_format, placeholder_size=size)
+        item.decode_ratio = 1.0 / source_scale if source_scale > 0 else 1.0
+        return item
+
+    def load_async(self) -> None:
+        """Decodes a placeholder's source on the thread pool and swaps it in when done."""
+        from CoffeeBoard.core.image_loader import decode_image
+        from CoffeeBoard.core.workers import run_in_background
+        # Rendered with this item's settings (detected, or restored from the
+        # board) so the worker's pixels are final
+        settings = self._display_settings()
+        run_in_background(decode_image, str(self.path), self.layer, False, settings,
+                          on_done=lambda decoded: self._on_decoded(decoded, settings),
+                          on_error=lambda msg: self._on_decoded(None))
+
+    def _on_decoded(self, decoded, rendered: Optional[Tuple[float, float, str, str]] = None) -> None:
+        """Installs a load_async() result; rendered is the display settings it was made with."""
+        from CoffeeBoard.core.image_loader import DECODE_DISPLAY
+        if rendered is None:
+            rendered = DECODE_DISPLAY  # decode_image()'s default
+        # Scale against the source, so the on-canvas size survives the swap
+        # (including any resize the user made while the placeholder was up)
+        source_scale = self.current_scale / self.decode_ratio
+        failed = False
+        if decoded is None:
+            # Nuke-only codecs, unreadable or missing files — the synchronous
+            # loader has the remaining tiers and the failure placeholder
+            from CoffeeBoard.core.image_loader import load_image, _placeholder_pixmap
+            try:
+                rendered = self._display_settings()
+                pixmap, self.linear_data, failed = load_image(str(self.path), self.layer, rendered)
+            except FileNotFoundError as e:
+                # Gone since the placeholder was made (moved, network dropout) —
+                # show the same failure card as an unreadable file
+                print(f"[CoffeeBoard] {e}")
+                pixmap = _placeholder_pixmap(os.path.basename(str(self.path)))
+                self.linear_data, failed = None, True
+        else:
+            qimage, self.linear_data = decoded
+            pixmap = QPixmap.fromImage(qimage)
+        self._make_preview_data()
+        self._loading = False
+        self.original_pixmap = pixmap
+        if failed:
+            # The placeholder was sized from the header; the card has its own size
+            self.decode_ratio = 1.0
+            self.current_scale = 1.0
+        else:
+            self.decode_ratio = self._source_ratio(pixmap)
+            self.current_scale = source_scale * self.decode_ratio
+        if self.linear_data is not None and self._display_settings() != rendered:
+            self._update_display_transform()  # settings changed since, re-render
+        else:
+            # Already rendered with these settings — no GUI-thread transform
+            self.resize_image(self.current_scale)
+
+    def _display_settings(self) -> Tuple[float, float, str, str]:
+        return (self.exposure, self.gamma, self.tone_mapping, self.colorspace)
+
+    def _on_clipboard_linear_ready(self, linear) -> None:
+        # Clipboard images are sRGB — set up so display controls work
+        self.linear_data = linear
+        self.colorspace = 'srgb'
+        self.tone_mapping = 'clamp'
+        self._make_preview_data()
+
     def _init_handles(self):
-        self._selection_border = _SelectionBorder(self)
-        self._handles = [_Handle(self, hp) for hp in HandlePos]
-        self._rotation_handles = [_RotationHandle(self, c)
-                                   for c in (HandlePos.TL, HandlePos.TR,
-                                             HandlePos.BL, HandlePos.BR)]
+        # Built by _ensure_handles() on first selection — most items on a large
+        # board are never selected, and each would otherwise own 13 hidden items
+        self._selection_border = None
+        self._handles = ()
+        self._rotation_handles = ()
         w = self.base_width()
         h = self.base_height()
         self.setTransformOriginPoint(w / 2, h / 2)
@@ -458,11 +597,21 @@ class ImageDisplay(QGraphicsPixmapItem):
             QPixmap: The loaded image, or a placeholder QPixmap if loading fails.
         """
         from CoffeeBoard.core.image_loader import load_image
-        pixmap, linear = load_image(path, layer)
+        pixmap, linear, failed = load_image(path, layer)
         self.linear_data = linear
         self._make_preview_data()
+        # The failure card has its own size; the header's says nothing about it
+        self.decode_ratio = 1.0 if failed else self._source_ratio(pixmap)
         return pixmap
 
+    def _source_ratio(self, pixmap: QPixmap) -> float:
+        """Source width / decoded width for this item's file (1.0 unless the loader downscaled)."""
+        from CoffeeBoard.core.image_loader import source_size
+        src = source_size(str(self.path))
+        if src is not None and pixmap.width() > 0 and src[0] > pixmap.width():
+            return src[0] / pixmap.width()
+        return 1.0
+
     _PREVIEW_MAX_PX = 1024
 
     def _make_preview_data(self) -> None:
@@ -493,6 +642,8 @@ class ImageDisplay(QGraphicsPixmapItem):
         self.setPixmap(preview_pixmap.scaled(
             target_w, target_h, Qt.KeepAspectRatio, Qt.FastTransformation
         ))
+        self._baked_scale = self.current_scale
+        self._baked_key = None  # low-quality preview; the next resize_image re-renders
 
     def hoverEnterEvent(self, event: QMouseEvent) -> None:
         """Changes the cursor to a pointing hand when hovering over the item."""
@@ -512,7 +663,17 @@ class ImageDisplay(QGraphicsPixmapItem):
                 self.hide_handles()
         return super().itemChange(change, value)
 
+    def _ensure_handles(self) -> None:
+        if self._selection_border is not None:
+            return
+        self._selection_border = _SelectionBorder(self)
+        self._handles = [_Handle(self, hp) for hp in HandlePos]
+        self._rotation_handles = [_RotationHandle(self, c)
+                                   for c in (HandlePos.TL, HandlePos.TR,
+                                             HandlePos.BL, HandlePos.BR)]
+
     def show_handles(self) -> None:
+        self._ensure_handles()
         self._selection_border.setVisible(True)
         for h in self._handles:
             h.setVisible(True)
@@ -521,6 +682,8 @@ class ImageDisplay(QGraphicsPixmapItem):
         self.update_handles()
 
     def hide_handles(self) -> None:
+        if self._selection_border is None:
+            return
         self._selection_border.setVisible(False)
         for h in self._handles:
             h.setVisible(False)
@@ -528,16 +691,25 @@ class ImageDisplay(QGraphicsPixmapItem):
             rh.setVisible(False)
 
     def update_handles(self) -> None:
-        w = self.base_width() * self.current_scale
-        h = self.base_height() * self.current_scale
+        if self._selection_border is None:
+            return  # never selected — nothing to lay out
+        # Children inherit preview_scale()'s transform; lay them out in
+        # pixmap coordinates so they still land on the displayed edges.
+        live = self.current_scale / self._baked_scale if self._baked_scale else 1.0
+        w = self.base_width() * self._baked_scale
+        h = self.base_height() * self._baked_scale
 
         # Scale handles so they remain a fixed ~12px on screen regardless of zoom.
-        vs = _get_view_scale(self)
+        vs = _get_view_scale(self) * live
         hs = max(5.0, 12.0 / vs)   # resize handle half-size in scene coords
         rs = max(5.0, 12.0 / vs)   # rotation handle half-size
         roff = max(_ROFF, 18.0 / vs)  # rotation handle offset from corner
 
         self._selection_border.setRect(0, 0, w, h)
+        pen = self._selection_border.pen()
+        if pen.widthF() != _BORDER_WIDTH / live:
+            pen.setWidthF(_BORDER_WIDTH / live)
+            self._selection_border.setPen(pen)
 
         positions = {
             HandlePos.TL: QPointF(0, 0),
@@ -576,12 +748,19 @@ class ImageDisplay(QGraphicsPixmapItem):
             scale_factor (float): The new scale factor to apply (e.g., 0.5 for half size).
         """
         self.current_scale = scale_factor
-        scaled_pixmap = self.original_pixmap.scaled(
-            self.original_pixmap.size() * scale_factor,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        self.setPixmap(scaled_pixmap)
+        self._baked_scale = scale_factor
+        # Skip the resample when the displayed pixmap already is this rendering,
+        # e.g. a board load restoring a placeholder at its saved size
+        key = (self.original_pixmap.cacheKey(), scale_factor)
+        if key != self._baked_key:
+            scaled_pixmap = self.original_pixmap.scaled(
+                self.original_pixmap.size() * scale_factor,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            self.setPixmap(scaled_pixmap)
+            self._baked_key = key
+        self.end_preview()
         self.setTransformOriginPoint(
             self.original_pixmap.width() * scale_factor / 2,
             self.original_pixmap.height() * scale_factor / 2
@@ -590,6 +769,35 @@ class ImageDisplay(QGraphicsPixmapItem):
 
     resize_item = resize_image
 
+    def preview_scale(self, scale_factor: float) -> None:
+        """Shows the image at scale_factor without re-rendering the pixmap.
+
+        Used while a resize handle is dragged: the already-rendered pixmap is
+        stretched by the item transform, so each mouse move costs no pixel
+        work. Call resize_image() afterwards to render it at full quality, or
+        end_preview() if the drag ended back at the rendered scale.
+
+        Args:
+            scale_factor (float): The new scale factor relative to the original pixmap.
+        """
+        self.current_scale = scale_factor
+        live = scale_factor / self._baked_scale
+        # transform() is applied after the rotation about transformOriginPoint,
+        # so the origin left at the rendered centre maps to the displayed centre
+        self.setTransform(QTransform.fromScale(live, live))
+        # Filter the stretch until end_preview()
+        if self._preview_mode is None:
+            self._preview_mode = self.transformationMode()
+            self.setTransformationMode(Qt.SmoothTransformation)
+        self.update_handles()
+
+    def end_preview(self) -> None:
+        """Drops preview_scale()'s stretch and restores the transformation mode it replaced."""
+        self.resetTransform()
+        if self._preview_mode is not None:
+            self.setTransformationMode(self._preview_mode)
+            self._preview_mode = None
+
     def _numpy_to_qimage(self, pixels) -> QImage:
         """Konvertera numpy uint16 array till QImage.
 
@@ -1,59 +1,96 @@
 """Tiered image loader — returns (QPixmap, linear_data_or_None).
 
+decode_image() runs the same tiers but stops at QImage, for worker threads.
+
 Tier 1 — OIIO (EXR only): full float32 linear data, HDR controls available.
-Tier 2 — Qt float32 (JPEG/PNG/TIFF/BMP): 8-bit source promoted to float32,
-          display-transformed to uint16 pixmap, HDR controls available.
+Tier 2 — Qt float32 (JPEG/PNG/TIFF/BMP): 8-bit source decoded at most
+          DECODE_MAX_EDGE px long, promoted to float32, display-transformed
+          to uint16 pixmap, HDR controls available.
+EXR linear data from Tier 1 is box-filtered to the same DECODE_MAX_EDGE cap.
 Tier 3 — Qt plain (EXR fallback when no OIIO): no linear_data, HDR unavailable.
+          For 'rgba' EXRs it runs before the Nuke re-encode, so an installed
+          Qt EXR plugin saves the Nuke round-trip.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import os
+import tempfile
 from typing import List, Optional, Tuple
 
 import numpy as np
 
 
+# Long-edge cap for decoded sources. An 8000x6000 photo is ~190 MB as float32
+# RGBA; decoding to <= 2048px keeps big boards in memory and every later
+# resize, repaint and texture upload small. Read at call time, so it can be
+# changed at runtime; existing items keep the resolution they decoded at.
+DECODE_MAX_EDGE = 2048
+
+# Accepted spellings of the default layer's channels, and the suffixes of a
+# named layer's channels, in R, G, B, A order
+_RGBA_CHANNEL_NAMES = (('R', 'r'), ('G', 'g'), ('B', 'b'), ('A', 'a'))
+_LAYER_SUFFIXES = ('R', 'G', 'B', 'A')
+
+# (exposure, gamma, tone_mapping, colorspace) decode_image renders with
+# unless the caller passes the item's own settings.
+DECODE_DISPLAY = (0.0, 2.2, 'reinhard', 'linear')
+
+# 8-bit formats decoded by Tier 2 (Qt float32)
+_QT_FLOAT_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp'})
+
+# Uncompressed Nuke re-encodes of PIZ/DWAA EXRs, reused across imports and
+# sessions. Least recently used files are dropped past the size cap. On disk
+# rather than /dev/shm: tmpfs would hold the cache in RAM until reboot, and
+# containers often mount only 64 MB of it. Read at call time, so it can be
+# pointed at a faster or larger disk at runtime.
+REENCODE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'coffeeboard_cache')
+_REENCODE_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
 # ---------------------------------------------------------------------------
 # EXR layer discovery (re-exported so canvas.py can use it directly)
 # ---------------------------------------------------------------------------
 
+def _layers_from_channels(channel_names) -> List[str]:
+    """Collapse channel names ('diffuse.R', 'R', ...) into sorted layer names."""
+    layers = set()
+    for ch in channel_names:
+        if '.' in ch:
+            layers.add(ch.split('.')[0])
+        else:
+            layers.add('rgba')
+    return sorted(layers) if layers else ['rgba']
+
+
 def get_exr_layers(path: str) -> List[str]:
     """Return unique layer names for an EXR file.
 
     Tier 1: OpenEXR binding. Tier 1b: OpenImageIO (Houdini).
     Tier 2: pure_exr header read. Falls back to ['rgba'].
+    All tiers read the header only — no pixel data is touched.
     """
     try:
         import OpenEXR
         import Imath
         f = OpenEXR.InputFile(path)
         try:
-            channel_names = list(f.header()['channels'].keys())
-            layers = set()
-            for ch in channel_names:
-                if '.' in ch:
-                    layers.add(ch.split('.')[0])
-                else:
-                    layers.add('rgba')
-            return sorted(layers) if layers else ['rgba']
+            return _layers_from_channels(f.header()['channels'].keys())
         finally:
             f.close()
     except Exception:
         pass
-    # Tier 1b: OpenImageIO (bundled with Houdini)
+    # Tier 1b: OpenImageIO (bundled with Houdini) — ImageInput opens the header
+    # without allocating an ImageBuf.
     try:
         import OpenImageIO as oiio
-        buf = oiio.ImageBuf(path)
-        if not buf.has_error:
-            channel_names = list(buf.spec().channelnames)
-            layers = set()
-            for ch in channel_names:
-                if '.' in ch:
-                    layers.add(ch.split('.')[0])
-                else:
-                    layers.add('rgba')
-            return sorted(layers) if layers else ['rgba']
+        inp = oiio.ImageInput.open(path)
+        if inp:
+            try:
+                return _layers_from_channels(inp.spec().channelnames)
+            finally:
+                inp.close()
     except Exception:
         pass
     # Tier 2: pure_exr header-only read
@@ -81,7 +118,7 @@ def _load_exr_via_oiio(path: str, layer: str = 'rgba') -> np.ndarray:
         width  = dw.max.x - dw.min.x + 1
         height = dw.max.y - dw.min.y + 1
 
-        channel_names = list(header['channels'].keys())
+        channel_names = header['channels']  # dict: O(1) membership below
         float_pt = Imath.PixelType(Imath.PixelType.FLOAT)
 
         if layer == 'rgba':
@@ -114,48 +151,158 @@ def _load_exr_via_oiio(path: str, layer: str = 'rgba') -> np.ndarray:
         f.close()
 
 
+def _reencode_cache_path(path: str, layer: str) -> str:
+    """Cache file for a Nuke re-encode of one layer of path, keyed by location and mtime."""
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{layer}"
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(REENCODE_CACHE_DIR, digest + '.exr')
+
+
+def _read_cached_reencode(path: str, layer: str = 'rgba') -> Optional[np.ndarray]:
+    """Decode a cached Nuke re-encode of path, or None on a miss.
+
+    Needs no Nuke, so worker threads can use it too.
+    """
+    try:
+        cached = _reencode_cache_path(path, layer)
+    except OSError:
+        return None
+    if not os.path.isfile(cached):
+        return None
+    from CoffeeBoard.core._pure_exr import read_exr
+    try:
+        linear = read_exr(cached.replace('\\', '/'), layer)
+    except Exception as e:
+        print(f'[CoffeeBoard] Dropping unreadable EXR cache entry {cached}: {e}')
+        try:
+            os.unlink(cached)
+        except OSError:
+            pass
+        return None
+    try:
+        os.utime(cached)  # mtime doubles as last-used time for pruning
+    except OSError:
+        pass
+    return linear
+
+
+def _prune_reencode_cache(max_bytes: int = _REENCODE_CACHE_MAX_BYTES) -> None:
+    """Delete least recently used cache files until the cache fits max_bytes."""
+    try:
+        entries = []
+        with os.scandir(REENCODE_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.exr'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(entry_path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _build_reencode_nodes():
+    """Create a throwaway Group holding the Read -> Write pair used for a Nuke re-encode.
+
+    The caller deletes the group before returning, so the nodes never outlive
+    the load and can't be saved into the artist's script.
+    """
+    import nuke
+
+    group = nuke.nodes.Group()
+    group['label'].setValue('CoffeeBoard EXR re-encode')
+    with group:
+        read_node = nuke.nodes.Read()
+        write_node = nuke.nodes.Write()
+    write_node['file_type'].setValue('exr')
+    write_node['compression'].setValue(0)  # 0 = no compression — _pure_exr reads raw bytes
+    write_node['datatype'].setValue('16 bit half')  # half the bytes of float; _pure_exr reads both
+    write_node.setInput(0, read_node)
+    return group, read_node, write_node
+
+
+def _quietly(fn, *args) -> None:
+    """Run a cleanup step without letting its failure mask the original error."""
+    with contextlib.suppress(Exception):
+        fn(*args)
+
+
 def _load_exr_via_nuke(path: str, layer: str = 'rgba') -> np.ndarray:
     """Re-encode EXR via Nuke's internal reader, then decode with _pure_exr.
 
-    Handles PIZ, DWAA, and any other compression Nuke supports.
-    Creates and immediately deletes temporary Read/Write nodes.
+    Handles PIZ, DWAA, and any other compression Nuke supports. The
+    uncompressed re-encode of the requested layer is kept in
+    REENCODE_CACHE_DIR, so re-adding the same unchanged file skips Nuke
+    entirely. A miss renders through a Read/Write pair that is deleted again
+    before this returns.
     """
+    linear = _read_cached_reencode(path, layer)
+    if linear is not None:
+        return linear
+
     import nuke
-    import tempfile
-    import os
 
-    fd, tmp = tempfile.mkstemp(suffix='.exr')
+    cached = _reencode_cache_path(path, layer)
+    # Derived from cached rather than re-read from REENCODE_CACHE_DIR, so a
+    # runtime change can't split the render and its rename across filesystems
+    cache_dir = os.path.dirname(cached)
+    # Render next to the cache entry and publish it with os.replace, so a
+    # failed or concurrent render never leaves a truncated file under its name
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix='.exr.part', dir=cache_dir)
+    except OSError as e:
+        # Unwritable cache dir — still load, just without caching
+        print(f'[CoffeeBoard] EXR re-encode cache unavailable ({e}), not caching {path}')
+        cached = None
+        fd, tmp = tempfile.mkstemp(suffix='.exr.part')
     os.close(fd)
     tmp_posix = tmp.replace('\\', '/')
     src_posix = str(path).replace('\\', '/')
 
-    nuke.Undo.disable()
-    read_node = write_node = None
-    try:
-        read_node = nuke.createNode('Read', inpanel=False)
-        read_node['file'].setValue(src_posix)
+    with contextlib.ExitStack() as cleanup:
+        # Callbacks run last-in first-out: nodes, then undo, then the temp
+        # file (already renamed away on success)
+        cleanup.callback(_quietly, os.unlink, tmp)
+        nuke.Undo.disable()
+        cleanup.callback(nuke.Undo.enable)
+
+        # A load re-entered from inside nuke.execute gets its own group
+        group, read_node, write_node = _build_reencode_nodes()
+        cleanup.callback(_quietly, nuke.delete, group)
 
-        write_node = nuke.createNode('Write', inpanel=False)
+        # fromUserText (unlike setValue) refreshes the frame range and format
+        read_node['file'].fromUserText(src_posix)
         write_node['file'].setValue(tmp_posix)
-        write_node['file_type'].setValue('exr')
-        write_node['compression'].setValue(0)  # 0 = no compression — _pure_exr reads raw bytes
-        write_node.setInput(0, read_node)
+        # Only the requested layer — 'rgba' keeps the alpha the default 'rgb' drops
+        try:
+            write_node['channels'].setValue(layer)
+        except Exception:
+            write_node['channels'].setValue('all')
 
         first = int(read_node['first'].value())
         nuke.execute(write_node, first, first)
 
         from CoffeeBoard.core._pure_exr import read_exr
-        return read_exr(tmp_posix, layer)
-    finally:
-        if write_node is not None:
-            nuke.delete(write_node)
-        if read_node is not None:
-            nuke.delete(read_node)
-        nuke.Undo.enable()
-        try:
-            os.unlink(tmp)
-        except OSError:
-            pass
+        linear = read_exr(tmp_posix, layer)
+        if cached is not None:
+            try:
+                os.replace(tmp, cached)
+            except OSError as e:
+                print(f'[CoffeeBoard] Could not cache the re-encode of {path}: {e}')
+                cached = None
+
+    if cached is not None:
+        _prune_reencode_cache()
+    return linear
 
 
 def _load_exr_via_openimageio(path: str, layer: str = 'rgba') -> np.ndarray:
@@ -166,34 +313,36 @@ def _load_exr_via_openimageio(path: str, layer: str = 'rgba') -> np.ndarray:
     if buf.has_error:
         raise RuntimeError(f"OIIO: {buf.geterror()}")
 
-    channel_names = list(buf.spec().channelnames)
+    # name -> channel index, built once; deep AOV files carry hundreds of channels
+    channel_index = {name: i for i, name in enumerate(buf.spec().channelnames)}
 
     if layer == 'rgba':
-        r = next((c for c in ['R', 'r'] if c in channel_names), None)
-        g = next((c for c in ['G', 'g'] if c in channel_names), None)
-        b = next((c for c in ['B', 'b'] if c in channel_names), None)
-        a = next((c for c in ['A', 'a'] if c in channel_names), None)
+        r, g, b, a = (next((c for c in names if c in channel_index), None)
+                      for names in _RGBA_CHANNEL_NAMES)
         if not all([r, g, b]):
             raise RuntimeError(f"No RGB channels found in {path}")
-        wanted = [c for c in [r, g, b, a] if c is not None]
+        wanted = [c for c in (r, g, b, a) if c is not None]
     else:
-        candidates = [f'{layer}.R', f'{layer}.G', f'{layer}.B', f'{layer}.A']
-        wanted = [c for c in candidates if c in channel_names]
+        candidates = [f'{layer}.{suffix}' for suffix in _LAYER_SUFFIXES]
+        wanted = [c for c in candidates if c in channel_index]
         if len(wanted) < 3:
             raise RuntimeError(f"Layer '{layer}' missing RGB channels in {path}")
 
-    indices = tuple(channel_names.index(c) for c in wanted)
+    indices = tuple(channel_index[c] for c in wanted)
     sub = oiio.ImageBufAlgo.channels(buf, indices)
     arr = np.asarray(sub.get_pixels(oiio.FLOAT), dtype=np.float32)
     return arr  # shape: (H, W, 3 or 4)
 
 
-def _numpy_to_pixmap(arr_16bit, width, height):
-    """Convert a uint16 (H, W, 4) numpy array to QPixmap."""
+def _numpy_to_qimage(arr_16bit, width, height):
+    """Convert a uint16 (H, W, 4) numpy array to a QImage that owns its pixels.
+
+    QImage is reentrant, so this (unlike QPixmap) is safe on worker threads.
+    """
     try:
-        from PySide2.QtGui import QImage, QPixmap
+        from PySide2.QtGui import QImage
     except ImportError:
-        from PySide6.QtGui import QImage, QPixmap
+        from PySide6.QtGui import QImage
 
     has_rgba64 = hasattr(QImage, 'Format_RGBA64')
     arr = np.ascontiguousarray(arr_16bit)
@@ -207,11 +356,139 @@ def _numpy_to_pixmap(arr_16bit, width, height):
         bytes_per_line = width * 4
         qimage = QImage(arr8.data, width, height, bytes_per_line, QImage.Format_RGBA8888)
 
-    return QPixmap.fromImage(qimage)
+    # Detach from the numpy buffer before it goes out of scope
+    return qimage.copy()
+
+
+def source_size(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (width, height) stored in the file header, or None if unreadable.
+
+    Only reads the header, so callers can compare against a downscaled decode cheaply.
+    """
+    try:
+        from PySide2.QtGui import QImageReader
+    except ImportError:
+        from PySide6.QtGui import QImageReader
+
+    if os.path.splitext(path)[1].lower() == '.exr':
+        # Qt has no EXR reader; the header is uncompressed whatever the codec
+        from CoffeeBoard.core._pure_exr import read_exr_size
+        try:
+            return read_exr_size(path)
+        except Exception:
+            return None
+
+    size = QImageReader(path).size()
+    if size.isValid() and size.width() > 0 and size.height() > 0:
+        return size.width(), size.height()
+    return None
+
+
+def decoded_size(path: str, src: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+    """Return the (width, height) decode_image() will produce for path, from the header alone.
+
+    Args:
+        path: Image file path.
+        src: The source size if the caller already read it via source_size().
+
+    Returns:
+        The capped decode size, or None if the header is unreadable.
+    """
+    if src is None:
+        src = source_size(path)
+        if src is None:
+            return None
+    w, h = src
+    max_edge = DECODE_MAX_EDGE  # one read, so both branches agree
+    if max(w, h) <= max_edge:
+        return w, h
+    if os.path.splitext(path)[1].lower() == '.exr':
+        return _capped_size(w, h, max_edge)
+    try:
+        from PySide2.QtCore import Qt, QSize
+    except ImportError:
+        from PySide6.QtCore import Qt, QSize
+    # Same rounding as _read_qimage_capped's setScaledSize
+    size = QSize(w, h).scaled(max_edge, max_edge, Qt.KeepAspectRatio)
+    return size.width(), size.height()
+
+
+def _capped_size(w: int, h: int, max_edge: int) -> Tuple[int, int]:
+    """Return (w, h) scaled so the long edge is exactly max_edge (unchanged if already within it)."""
+    long_edge = max(w, h)
+    if long_edge <= max_edge:
+        return w, h
+    return max(1, round(w * max_edge / long_edge)), max(1, round(h * max_edge / long_edge))
+
+
+def _resample_axis(data: np.ndarray, size: int, axis: int) -> np.ndarray:
+    """Linearly resample float data along axis to size samples, matching pixel centres."""
+    n = data.shape[axis]
+    pos = np.clip((np.arange(size) + 0.5) * (n / size) - 0.5, 0, n - 1)
+    i0 = np.floor(pos).astype(np.intp)
+    i1 = np.minimum(i0 + 1, n - 1)
+    shape = [1] * data.ndim
+    shape[axis] = size
+    t = (pos - i0).astype(np.float32).reshape(shape)
+    a = np.take(data, i0, axis=axis)
+    return a + (np.take(data, i1, axis=axis) - a) * t
+
+
+def _cap_linear(linear: np.ndarray, max_edge: int) -> np.ndarray:
+    """Downscale float data so its long edge is exactly max_edge.
+
+    Box-filters each axis by the largest whole factor that keeps it >= its target
+    (1 for an axis already there, e.g. the short edge of a long strip), then
+    linearly resamples the remaining (< 2x) step to the size decoded_size() reports.
+    """
+    h, w, c = linear.shape
+    if max(h, w) <= max_edge:
+        return linear
+    tw, th = _capped_size(w, h, max_edge)
+    fy, fx = max(1, h // th), max(1, w // tw)
+    if fy > 1 or fx > 1:
+        h2, w2 = h // fy, w // fx
+        blocks = linear[:h2 * fy, :w2 * fx].reshape(h2, fy, w2, fx, c)
+        linear = blocks.mean(axis=(1, 3), dtype=np.float32)
+    if linear.shape[:2] != (th, tw):
+        linear = _resample_axis(_resample_axis(linear, th, 0), tw, 1)
+    return np.ascontiguousarray(linear, dtype=np.float32)
+
+
+def _read_qimage_capped(path: str, max_edge: Optional[int] = None):
+    """Decode path with QImageReader, scaling during decode so the long edge is <= max_edge.
+
+    max_edge defaults to DECODE_MAX_EDGE.
+    """
+    try:
+        from PySide2.QtGui import QImageReader
+        from PySide2.QtCore import Qt
+    except ImportError:
+        from PySide6.QtGui import QImageReader
+        from PySide6.QtCore import Qt
+
+    if max_edge is None:
+        max_edge = DECODE_MAX_EDGE
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        if max(size.width(), size.height()) > max_edge:
+            # JPEG decoders downsample in the IDCT, so the full-res frame is never allocated
+            reader.setScaledSize(size.scaled(max_edge, max_edge, Qt.KeepAspectRatio))
+        return reader.read()
+    # Some plugins only know the size after decoding — cap the result instead
+    img = reader.read()
+    if not img.isNull() and max(img.width(), img.height()) > max_edge:
+        img = img.scaled(max_edge, max_edge, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return img
+
+
+_failed_base = None  # gray "Failed to load:" card, built on first use (needs a QApplication)
 
 
 def _placeholder_pixmap(filename: str):
     """Return a gray placeholder pixmap with the filename as text."""
+    global _failed_base
     try:
         from PySide2.QtGui import QPixmap, QColor, QPainter
         from PySide2.QtCore import Qt
@@ -219,12 +496,21 @@ def _placeholder_pixmap(filename: str):
         from PySide6.QtGui import QPixmap, QColor, QPainter
         from PySide6.QtCore import Qt
 
-    pixmap = QPixmap(400, 300)
-    pixmap.fill(QColor(60, 60, 60))
+    if _failed_base is None:
+        _failed_base = QPixmap(400, 300)
+        _failed_base.fill(QColor(60, 60, 60))
+        painter = QPainter(_failed_base)
+        painter.setPen(QColor(150, 150, 150))
+        painter.drawText(_failed_base.rect().adjusted(0, 0, 0, -150),
+                         Qt.AlignHCenter | Qt.AlignBottom, "Failed to load:")
+        painter.end()
+
+    # Only the filename line is drawn per failure
+    pixmap = _failed_base.copy()
     painter = QPainter(pixmap)
     painter.setPen(QColor(150, 150, 150))
-    painter.drawText(pixmap.rect(), Qt.AlignCenter,
-                     f"Failed to load:\n{filename}")
+    painter.drawText(pixmap.rect().adjusted(0, 150, 0, 0),
+                     Qt.AlignHCenter | Qt.AlignTop, filename)
     painter.end()
     return pixmap
 
@@ -233,32 +519,74 @@ def _placeholder_pixmap(filename: str):
 # Public API
 # ---------------------------------------------------------------------------
 
-def load_image(path: str, layer: str = 'rgba') -> Tuple[object, Optional[np.ndarray]]:
-    """Load an image file and return (QPixmap, linear_data_or_None).
+def load_image(path: str, layer: str = 'rgba',
+               display: Tuple[float, float, str, str] = DECODE_DISPLAY
+               ) -> Tuple[object, Optional[np.ndarray], bool]:
+    """Load an image file and return (QPixmap, linear_data_or_None, failed).
 
     Tier 1 — OIIO (EXR): full float32 linear, HDR controls active.
-    Tier 2 — Qt float32 (JPEG/PNG/TIFF/BMP): promoted to float32, HDR active.
+    Tier 2 — Qt float32 (JPEG/PNG/TIFF/BMP): capped to DECODE_MAX_EDGE, promoted to float32, HDR active.
     Tier 3 — Qt plain (EXR without OIIO): no linear_data, HDR inactive.
-    Fallback — gray placeholder on total failure.
+    Fallback — gray placeholder on total failure, with failed set so callers
+    don't size it against the file header.
+
+    display is passed through to decode_image().
+
+    Raises:
+        FileNotFoundError: If no tier could load the file because it does not exist.
+    """
+    try:
+        from PySide2.QtGui import QPixmap
+    except ImportError:
+        from PySide6.QtGui import QPixmap
+
+    decoded = decode_image(path, layer, display=display)
+    if decoded is not None:
+        qimage, linear = decoded
+        pixmap = QPixmap.fromImage(qimage)
+        if not pixmap.isNull():
+            return pixmap, linear, False
+
+    # --- Total failure: gray placeholder, unless the file is simply missing ---
+    # (checked only here, so successful loads never pay for an extra stat)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File does not exist: {path}")
+    return _placeholder_pixmap(os.path.basename(path)), None, True
+
+
+def decode_image(path: str, layer: str = 'rgba', allow_nuke: bool = True,
+                 display: Tuple[float, float, str, str] = DECODE_DISPLAY
+                 ) -> Optional[Tuple[object, Optional[np.ndarray]]]:
+    """Run the loader tiers and return (QImage, linear_data_or_None), or None if all fail.
+
+    Produces no QPixmap, so it can run on a worker thread as long as
+    allow_nuke is False — Nuke's node API is main-thread only.
+
+    Args:
+        display: (exposure, gamma, tone_mapping, colorspace) to render the
+            QImage with, so a caller that knows the item's settings gets final pixels.
     """
     from CoffeeBoard.core.display_pipeline import apply_display_transform
 
     ext = os.path.splitext(path)[1].lower()
+    # Bound once: a runtime change can't give one decode two different caps
+    max_edge = DECODE_MAX_EDGE
+    qt_tried = False  # Tier 3 already ran early for this file
 
     # --- Tier 1: OIIO for EXR ---
     if ext == '.exr':
         try:
-            linear = _load_exr_via_oiio(path, layer)
-            pixels_16 = apply_display_transform(linear, 0.0, 2.2, 'reinhard')
+            linear = _cap_linear(_load_exr_via_oiio(path, layer), max_edge)
+            pixels_16 = apply_display_transform(linear, *display)
 
             h, w, c = pixels_16.shape
             if c == 3:
                 alpha = np.full((h, w, 1), 65535, dtype=np.uint16)
                 pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
 
-            pixmap = _numpy_to_pixmap(pixels_16, w, h)
-            if not pixmap.isNull():
-                return pixmap, linear
+            qimage = _numpy_to_qimage(pixels_16, w, h)
+            if not qimage.isNull():
+                return qimage, linear
         except ImportError:
             pass  # OIIO not installed — fall through to Tier 2
         except Exception as e:
@@ -266,17 +594,17 @@ def load_image(path: str, layer: str = 'rgba') -> Tuple[object, Optional[np.ndar
 
         # --- Tier 1b: OpenImageIO (bundled with Houdini) ---
         try:
-            linear = _load_exr_via_openimageio(path, layer)
-            pixels_16 = apply_display_transform(linear, 0.0, 2.2, 'reinhard')
+            linear = _cap_linear(_load_exr_via_openimageio(path, layer), max_edge)
+            pixels_16 = apply_display_transform(linear, *display)
 
             h, w, c = pixels_16.shape
             if c == 3:
                 alpha = np.full((h, w, 1), 65535, dtype=np.uint16)
                 pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
 
-            pixmap = _numpy_to_pixmap(pixels_16, w, h)
-            if not pixmap.isNull():
-                return pixmap, linear
+            qimage = _numpy_to_qimage(pixels_16, w, h)
+            if not qimage.isNull():
+                return qimage, linear
         except ImportError:
             pass  # OpenImageIO not available
         except Exception as e:
@@ -285,49 +613,65 @@ def load_image(path: str, layer: str = 'rgba') -> Tuple[object, Optional[np.ndar
         # --- Tier 2: pure-Python EXR (no compiled deps) ---
         try:
             from CoffeeBoard.core._pure_exr import read_exr, UnsupportedCompression
-            linear = read_exr(path, layer)
-            pixels_16 = apply_display_transform(linear, 0.0, 2.2, 'reinhard')
+            linear = _cap_linear(read_exr(path, layer), max_edge)
+            pixels_16 = apply_display_transform(linear, *display)
 
             h, w, c = pixels_16.shape
             if c == 3:
                 alpha = np.full((h, w, 1), 65535, dtype=np.uint16)
                 pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
 
-            pixmap = _numpy_to_pixmap(pixels_16, w, h)
-            if not pixmap.isNull():
-                return pixmap, linear
+            qimage = _numpy_to_qimage(pixels_16, w, h)
+            if not qimage.isNull():
+                return qimage, linear
         except UnsupportedCompression:
             pass  # PIZ/DWAA → try Nuke tier
         except Exception as e:
             print(f'[CoffeeBoard] pure_exr failed for {path}: {e}')
 
         # --- Tier 2b: Nuke native EXR (handles PIZ/DWAA/any Nuke-supported compression) ---
-        try:
-            linear = _load_exr_via_nuke(path, layer)
-            pixels_16 = apply_display_transform(linear, 0.0, 2.2, 'reinhard')
-
-            h, w, c = pixels_16.shape
-            if c == 3:
-                alpha = np.full((h, w, 1), 65535, dtype=np.uint16)
-                pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
+        # A cached re-encode needs no Nuke. Off the main thread only that can be
+        # used — on a miss callers fall back to load_image()
+        linear = _read_cached_reencode(path, layer)
+        if linear is None and layer == 'rgba':
+            # An installed Qt EXR image plugin skips Nuke entirely (display
+            # only, no linear data); without one this is a header probe
+            qt_tried = True
+            try:
+                img = _read_qimage_capped(path, max_edge)
+                if not img.isNull():
+                    return img, None
+            except Exception as e:
+                print(f"[CoffeeBoard] Qt EXR load failed for {path}: {e}")
+        if allow_nuke or linear is not None:
+            try:
+                if linear is None:
+                    linear = _load_exr_via_nuke(path, layer)
+                linear = _cap_linear(linear, max_edge)
+                pixels_16 = apply_display_transform(linear, *display)
+
+                h, w, c = pixels_16.shape
+                if c == 3:
+                    alpha = np.full((h, w, 1), 65535, dtype=np.uint16)
+                    pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
 
-            pixmap = _numpy_to_pixmap(pixels_16, w, h)
-            if not pixmap.isNull():
-                return pixmap, linear
-        except ImportError:
-            pass  # Not running in Nuke
-        except Exception as e:
-            print(f'[CoffeeBoard] Nuke EXR load failed for {path}: {e}')
+                qimage = _numpy_to_qimage(pixels_16, w, h)
+                if not qimage.isNull():
+                    return qimage, linear
+            except ImportError:
+                pass  # Not running in Nuke
+            except Exception as e:
+                print(f'[CoffeeBoard] Nuke EXR load failed for {path}: {e}')
 
     # --- Tier 2: Qt float32 for standard formats ---
-    if ext in ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp'):
+    if ext in _QT_FLOAT_EXTS:
         try:
             try:
-                from PySide2.QtGui import QImage, QPixmap
+                from PySide2.QtGui import QImage
             except ImportError:
-                from PySide6.QtGui import QImage, QPixmap
+                from PySide6.QtGui import QImage
 
-            img = QImage(path).convertToFormat(QImage.Format_RGBA8888)
+            img = _read_qimage_capped(path, max_edge).convertToFormat(QImage.Format_RGBA8888)
             w, h = img.width(), img.height()
             if w > 0 and h > 0:
                 ptr = img.constBits()
@@ -338,7 +682,7 @@ def load_image(path: str, layer: str = 'rgba') -> Tuple[object, Optional[np.ndar
                 arr = arr.reshape(h, w, 4).astype(np.float32) / 255.0
                 arr = arr.copy()  # detach from Qt memory before img goes out of scope
 
-                pixels_16 = apply_display_transform(arr, 0.0, 2.2, 'reinhard')
+                pixels_16 = apply_display_transform(arr, *display)
 
                 # Ensure RGBA (4 channels)
                 ph, pw, pc = pixels_16.shape
@@ -346,24 +690,19 @@ def load_image(path: str, layer: str = 'rgba') -> Tuple[object, Optional[np.ndar
                     alpha = np.full((ph, pw, 1), 65535, dtype=np.uint16)
                     pixels_16 = np.concatenate([pixels_16, alpha], axis=2)
 
-                pixmap = _numpy_to_pixmap(pixels_16, pw, ph)
-                if not pixmap.isNull():
-                    return pixmap, arr
+                qimage = _numpy_to_qimage(pixels_16, pw, ph)
+                if not qimage.isNull():
+                    return qimage, arr
         except Exception as e:
             print(f"[CoffeeBoard] Qt float32 load failed for {path}: {e}")
 
     # --- Tier 3: Qt plain fallback (EXR without OIIO, or any format Qt supports) ---
-    try:
+    if not qt_tried:
         try:
-            from PySide2.QtGui import QPixmap
-        except ImportError:
-            from PySide6.QtGui import QPixmap
-
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            return pixmap, None
-    except Exception as e:
-        print(f"[CoffeeBoard] Qt plain load failed for {path}: {e}")
+            img = _read_qimage_capped(path, max_edge)
+            if not img.isNull():
+                return img, None
+        except Exception as e:
+            print(f"[CoffeeBoard] Qt plain load failed for {path}: {e}")
 
-    # --- Total failure: gray placeholder ---
-    return _placeholder_pixmap(os.path.basename(path)), None
+    return None
@@ -25,7 +25,8 @@ class CoffeeBoardUndoStack:
     def setUndoLimit(self, n: int) -> None:
         self._limit = n
 
-    def push(self, cmd: _Command) -> None:
+    def push(self, cmd: _Command, notify: bool = True) -> None:
+        # notify=False lets batch callers fire a single refresh when they are done
         cmd.redo()
         # Try to merge into the top of history (same id, same item)
         if self._history:
@@ -33,13 +34,15 @@ class CoffeeBoardUndoStack:
             if top.id() != -1 and top.id() == cmd.id():
                 if top.mergeWith(cmd):
                     self._future.clear()
-                    self._notify()
+                    if notify:
+                        self._notify()
                     return
         self._history.append(cmd)
         self._future.clear()
         while len(self._history) > self._limit:
             self._history.pop(0)
-        self._notify()
+        if notify:
+            self._notify()
 
     def undo(self) -> None:
         if self._history:
@@ -131,6 +134,32 @@ class DeleteItemCommand(_Command):
             self._list.remove(self._item)
 
 
+class DeleteItemsCommand(_Command):
+    """Removes several items as one undo step."""
+
+    def __init__(self, canvas, groups) -> None:
+        super().__init__()
+        # groups: list of (item_list, items) — item_list is mutated in place
+        self._canvas = canvas
+        self._groups = [(lst, list(items)) for lst, items in groups if items]
+
+    def undo(self) -> None:
+        for lst, items in self._groups:
+            present = set(lst)
+            for item in items:
+                self._canvas.scene.addItem(item)
+                if item not in present:
+                    lst.append(item)
+
+    def redo(self) -> None:
+        for lst, items in self._groups:
+            doomed = set(items)
+            for item in items:
+                self._canvas.scene.removeItem(item)
+            # One rebuild instead of a list.remove() scan per item
+            lst[:] = [i for i in lst if i not in doomed]
+
+
 class ZOrderCommand(_Command):
     def __init__(self, before: list, after: list) -> None:
         # before / after: list of (item, z_value) for ALL items on board
@@ -0,0 +1,68 @@
+"""Background jobs on QThreadPool with results delivered on the GUI thread.
+
+Workers may only touch reentrant Qt types (QImage, not QPixmap). Callbacks run
+on the GUI thread via a queued signal, so they can safely update scene items.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+try:
+    from PySide2.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+except ImportError:
+    from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+
+
+class _JobSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _Job(QRunnable):
+    def __init__(self, fn: Callable, args: tuple, signals: _JobSignals) -> None:
+        super().__init__()
+        self._fn, self._args, self._signals = fn, args, signals
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+        else:
+            self._signals.finished.emit(result)
+
+
+# Signal objects must outlive their job until the queued result is delivered.
+_pending: set = set()
+
+
+def run_in_background(fn: Callable, *args: Any,
+                      on_done: Optional[Callable[[Any], None]] = None,
+                      on_error: Optional[Callable[[str], None]] = None) -> None:
+    """Run fn(*args) on the global thread pool.
+
+    Args:
+        fn: Callable executed on a worker thread.
+        on_done: Called on the GUI thread with fn's return value.
+        on_error: Called on the GUI thread with the error message. If omitted,
+                  the error is printed.
+    """
+    signals = _JobSignals()
+    _pending.add(signals)
+
+    def _finish(result: Any) -> None:
+        _pending.discard(signals)
+        if on_done is not None:
+            on_done(result)
+
+    def _fail(msg: str) -> None:
+        _pending.discard(signals)
+        if on_error is not None:
+            on_error(msg)
+        else:
+            print(f"[CoffeeBoard] Background job failed: {msg}")
+
+    signals.finished.connect(_finish, Qt.QueuedConnection)
+    signals.failed.connect(_fail, Qt.QueuedConnection)
+    QThreadPool.globalInstance().start(_Job(fn, args, signals))
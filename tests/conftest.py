@@ -0,0 +1,36 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_coffeeboard():
+    """Import this checkout as the CoffeeBoard package, whatever its folder is called."""
+    if 'CoffeeBoard' in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location(
+        'CoffeeBoard', os.path.join(_ROOT, '__init__.py'),
+        submodule_search_locations=[_ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['CoffeeBoard'] = module
+    spec.loader.exec_module(module)
+
+
+_import_coffeeboard()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """A QApplication for the whole session (QPixmap needs one)."""
+    try:
+        from PySide2.QtWidgets import QApplication
+    except ImportError:
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            pytest.skip("PySide2/PySide6 not installed")
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,47 @@
+import struct
+import zlib
+
+import pytest
+
+
+def _write_truncated_png(path, width, height):
+    """A PNG whose IHDR is valid but whose image data is missing."""
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    chunk = b'IHDR' + ihdr
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(struct.pack('>I', len(ihdr)) + chunk + struct.pack('>I', zlib.crc32(chunk)))
+        # The file ends a few bytes into its first IDAT chunk
+        f.write(struct.pack('>I', 65536) + b'IDAT' + zlib.compress(b'\0' * 64)[:8])
+
+
+@pytest.fixture
+def broken_png(tmp_path):
+    path = str(tmp_path / 'broken.png')
+    _write_truncated_png(path, 6000, 4000)
+    return path
+
+
+def test_failure_card_ignores_header_size(qapp, broken_png):
+    from CoffeeBoard.core.image_item import ImageDisplay
+    from CoffeeBoard.core.image_loader import source_size
+
+    assert source_size(broken_png) == (6000, 4000)
+    item = ImageDisplay(broken_png, 'rgba', 'png')
+    assert item.decode_ratio == 1.0
+    assert (item.original_pixmap.width(), item.original_pixmap.height()) == (400, 300)
+
+
+def test_placeholder_failure_card_ignores_header_size(qapp, broken_png):
+    from CoffeeBoard.core.image_item import ImageDisplay
+    from CoffeeBoard.core.image_loader import decode_image, decoded_size
+
+    size = decoded_size(broken_png)
+    item = ImageDisplay.create_placeholder(broken_png, 'rgba', 'png', size, size[0] / 6000)
+    # What load_async() delivers when every worker tier fails
+    item._on_decoded(decode_image(broken_png, 'rgba', False))
+
+    assert not item._loading
+    assert item.decode_ratio == 1.0
+    assert item.current_scale == 1.0
+    assert item.pixmap().width() == 400
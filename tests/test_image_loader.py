@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from CoffeeBoard.core.image_loader import _cap_linear, _capped_size
+
+
+@pytest.mark.parametrize('h, w', [
+    (2049, 100),    # just over the cap
+    (4097, 4097),   # just over a whole factor
+    (3, 10000),     # short edge under the box factor
+    (10000, 3),
+])
+def test_cap_linear_matches_capped_size(h, w):
+    linear = np.ones((h, w, 4), dtype=np.float32)
+    capped = _cap_linear(linear, 2048)
+    tw, th = _capped_size(w, h, 2048)
+    assert capped.shape == (th, tw, 4)
+    assert max(th, tw) == 2048
+    assert np.allclose(capped, 1.0)
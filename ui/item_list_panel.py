@@ -217,6 +217,8 @@ class ItemListPanel(QFrame):
         for row_idx in range(n):
             item = self._list.item(row_idx).data(Qt.UserRole)
             item.setZValue(n - 1 - row_idx)   # row 0 → highest z
+        if n:
+            canvas.note_z_range(0.0, float(n - 1))
 
         after = [(item, item.zValue()) for item in all_items]
 